@@ -32,6 +32,10 @@ if %errorlevel% neq 0 (
     exit /b 1
 )
 
+REM Editable installs skip byte-compilation, so do it now instead of on the first kinda run
+echo ⚡ Precompiling kinda bytecode...
+%PYTHON_CMD% -m compileall -q kinda
+
 echo.
 echo 🎉 Installation complete! (probably)
 echo.
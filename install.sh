@@ -47,6 +47,10 @@ pip install -e . || {
   exit 1
 }
 
+# Editable installs skip byte-compilation, so do it now instead of on the first `kinda` run
+echo "⚡ Precompiling kinda bytecode..."
+python -m compileall -q kinda || echo "⚠️  Bytecode precompile failed - kinda will compile on first run"
+
 echo "🧪 Installing dev dependencies (pytest, black, mypy)..."
 pip install -e .[dev] || {
   echo "💥 Dev dependencies install failed."
@@ -1,10 +1,10 @@
 # kinda/cli.py
 
-import argparse
 import os
 import sys
-from pathlib import Path
-from typing import Union, Optional
+from functools import lru_cache
+from types import ModuleType, SimpleNamespace
+from typing import Any, Dict, Optional, Union
 
 # Optional chardet import for encoding detection
 try:
@@ -17,33 +17,55 @@ except ImportError:
 # Import personality system
 from kinda.personality import PersonalityContext, PERSONALITY_PROFILES
 
+# Emoji -> ASCII stand-ins, applied in order, for consoles that can't encode them
+_EMOJI_FALLBACKS = (
+    ("✨", "*"),  # sparkle -> asterisk
+    ("🎲", "*"),  # die -> asterisk
+    ("[shrug]", "?"),  # shrug -> question mark
+    ("📚", "*"),  # book -> asterisk
+    ("📝", "*"),  # memo -> asterisk
+    ("🎯", "*"),  # target -> asterisk
+    ("[?]", "?"),  # thinking -> question mark
+    ("[shrug]‍♂️", "?"),  # shrug man -> question mark
+    ("🙄", "~"),  # eye roll -> tilde
+    ("🎮", "*"),  # game controller -> asterisk
+    ("🎉", "!"),  # party -> exclamation
+    ("😅", "~"),  # sweat smile -> tilde
+    ("🙃", "~"),  # upside down -> tilde
+    ("🔮", "*"),  # crystal ball -> asterisk
+    ("🌪️", "~"),  # tornado -> tilde
+    ("🤨", "?"),  # raised eyebrow -> question mark
+    ("💥", "!"),  # explosion -> exclamation mark
+    ("✅", "+"),  # check mark -> plus sign
+    ("⚠️", "!"),  # warning -> exclamation mark
+    ("📂", "*"),  # folder -> asterisk
+    ("•", "-"),  # bullet -> dash
+    ("±", "+/-"),  # plus-minus -> plus slash minus
+)
+
+# KINDA_PLAIN=1 prints ASCII-only output up front (CI logs, benchmarks, legacy consoles)
+_PLAIN = os.environ.get("KINDA_PLAIN") == "1"
+
+
+def _ascii_fallback(text: str) -> str:
+    """Swap known emojis for ASCII stand-ins"""
+    for emoji, replacement in _EMOJI_FALLBACKS:
+        text = text.replace(emoji, replacement)
+    return text
+
 
 def safe_print(text: str) -> None:
     """Print text with Windows-safe encoding fallbacks"""
+    if _PLAIN:
+        # Same result as the final fallback below, minus the failed encode attempts
+        print(_ascii_fallback(text).encode("ascii", errors="replace").decode("ascii"))
+        return
+
     try:
         print(text)
     except UnicodeEncodeError:
         # Fallback for Windows: replace problematic emojis with ASCII
-        fallback = (
-            text.replace("✨", "*")  # sparkle -> asterisk
-            .replace("🎲", "*")  # die -> asterisk
-            .replace("[shrug]", "?")  # shrug -> question mark
-            .replace("📚", "*")  # book -> asterisk
-            .replace("📝", "*")  # memo -> asterisk
-            .replace("🎯", "*")  # target -> asterisk
-            .replace("[?]", "?")  # thinking -> question mark
-            .replace("[shrug]‍♂️", "?")  # shrug man -> question mark
-            .replace("🙄", "~")  # eye roll -> tilde
-            .replace("🎮", "*")  # game controller -> asterisk
-            .replace("🎉", "!")  # party -> exclamation
-            .replace("😅", "~")  # sweat smile -> tilde
-            .replace("🙃", "~")  # upside down -> tilde
-            .replace("🔮", "*")  # crystal ball -> asterisk
-            .replace("🌪️", "~")  # tornado -> tilde
-            .replace("🤨", "?")  # raised eyebrow -> question mark
-            .replace("💥", "!")  # explosion -> exclamation mark
-            .replace("✅", "+")  # check mark -> plus sign
-        )
+        fallback = _ascii_fallback(text)
         try:
             print(fallback)
         except UnicodeEncodeError:
@@ -51,7 +73,7 @@ def safe_print(text: str) -> None:
             print(fallback.encode("ascii", errors="replace").decode("ascii"))
 
 
-def safe_read_file(file_path: Path) -> str:
+def safe_read_file(file_path: Union[str, os.PathLike]) -> str:
     """Safely read a file with encoding detection and error handling"""
     try:
         # First try reading as binary to detect encoding
@@ -96,11 +118,11 @@ def safe_read_file(file_path: Path) -> str:
         raise
 
 
-def validate_knda_file(file_path: Path) -> bool:
+def validate_knda_file(file_path: Union[str, os.PathLike]) -> bool:
     """Validate that a .knda file can be processed"""
     try:
         # Check if it's a directory
-        if file_path.is_dir():
+        if os.path.isdir(file_path):
             # For directories, validation passes - let the transformer handle it
             return True
 
@@ -125,12 +147,10 @@ def validate_knda_file(file_path: Path) -> bool:
         return False
 
 
-def show_examples():
-    """Show example kinda programs with attitude"""
-    safe_print("🎲 Here are some kinda programs to get you started:")
-    print()
-
-    examples = [
+# (title, file, description, description split into lines) - built once at import
+_EXAMPLES = tuple(
+    (title, filename, description, tuple(description.split("\n")))
+    for title, filename, description in (
         # Basic examples
         ("Hello World", "examples/python/hello.py.knda", "The classic, but fuzzy"),
         ("Chaos Greeter", "examples/python/unified_syntax.py.knda", "Variables that kinda work"),
@@ -187,28 +207,32 @@ def show_examples():
             "examples/python/comprehensive/chaos_arena2_complete.py.knda",
             "Multi-agent simulation with ALL constructs",
         ),
-    ]
+    )
+)
+
+
+def show_examples():
+    """Show example kinda programs with attitude"""
+    out = ["🎲 Here are some kinda programs to get you started:", ""]
 
-    for title, filename, description in examples:
-        safe_print(f"📝 {title}")
-        if filename and Path(filename).exists():
-            print(f"   Try: kinda run {filename}")
-            print(f"   Or:  kinda interpret {filename}")
+    for title, filename, description, description_lines in _EXAMPLES:
+        out.append(f"📝 {title}")
+        if filename and os.path.exists(filename):
+            out.append(f"   Try: kinda run {filename}")
+            out.append(f"   Or:  kinda interpret {filename}")
         elif description:
-            print("   Example code:")
-            for line in description.split("\n"):
-                print(f"   {line}")
-        print(f"   {description}")
-        print()
+            out.append("   Example code:")
+            out.extend(f"   {line}" for line in description_lines)
+        out.append(f"   {description}")
+        out.append("")
 
-    safe_print("[shrug] Pro tip: Run any example with 'interpret' for maximum chaos")
+    out.append("[shrug] Pro tip: Run any example with 'interpret' for maximum chaos")
+    # One write instead of a print() per line
+    safe_print("\n".join(out))
 
 
 def show_syntax_reference():
     """Show syntax reference with snark"""
-    safe_print("📚 Kinda Syntax Reference (your cheat sheet)")
-    print()
-
     constructs = [
         ("~kinda int x = 42", "Fuzzy integer (adds ±1 noise)"),
         ("~kinda int y ~= 10", "Extra fuzzy assignment"),
@@ -219,22 +243,38 @@ def show_syntax_reference():
         ("x ~= x + 1", "Fuzzy reassignment"),
     ]
 
-    safe_print("✨ Basic Constructs:")
-    for syntax, description in constructs:
-        print(f"   {syntax:<25} # {description}")
+    out = ["📚 Kinda Syntax Reference (your cheat sheet)", "", "✨ Basic Constructs:"]
+    out.extend(f"   {syntax:<25} # {description}" for syntax, description in constructs)
+    out.extend(
+        [
+            "",
+            "🎯 Pro Tips:",
+            "   • Everything fuzzy starts with ~",
+            "   • Your code will behave... differently each time",
+            "   • That's the point. Embrace the chaos.",
+            "   • Use 'kinda examples' to see it in action",
+        ]
+    )
+    # One write instead of a print() per line
+    safe_print("\n".join(out))
+
 
-    print()
-    safe_print("🎯 Pro Tips:")
-    print("   • Everything fuzzy starts with ~")
-    print("   • Your code will behave... differently each time")
-    print("   • That's the point. Embrace the chaos.")
-    print("   • Use 'kinda examples' to see it in action")
+# Transformer modules already resolved by get_transformer(), keyed by language
+_TRANSFORMERS: Dict[str, Any] = {}
 
 
 def get_transformer(lang: str):
+    transformer = _TRANSFORMERS.get(lang)
+    if transformer is not None:
+        return transformer
+
     if lang == "python":
-        from kinda.langs.python import transformer
+        # Peek at sys.modules first so repeat lookups skip the import machinery
+        transformer = sys.modules.get("kinda.langs.python.transformer")
+        if transformer is None:
+            from kinda.langs.python import transformer
 
+        _TRANSFORMERS[lang] = transformer
         return transformer
     elif lang == "c":
         # C support is coming in v0.4.0 - currently incomplete
@@ -331,13 +371,37 @@ def setup_personality(mood: str, chaos_level: int = 5, seed: Optional[int] = Non
         safe_print(f"🌱 Using random seed {resolved_seed} for reproducible chaos ({seed_source})")
 
 
-def detect_language(path: Path, forced: Union[str, None]) -> str:
+def _suggest_similar_files(input_path: str, heading: str) -> None:
+    """Point at up to three .knda files next to a path that doesn't exist."""
+    # Only reached on the error path, so pathlib's import cost doesn't matter here
+    from pathlib import Path
+
+    parent = Path(input_path).parent
+    if parent.exists():
+        similar_files = list(parent.glob("*.knda"))
+        if similar_files:
+            safe_print(heading)
+            for f in similar_files[:3]:  # Show max 3 suggestions
+                safe_print(f"   • {f.name}")
+
+
+def _looks_like_knda(input_path: str) -> bool:
+    """Reject inputs that obviously aren't kinda source (directories are fine)."""
+    if input_path.endswith(".knda") or os.path.isdir(input_path):
+        return True
+    safe_print(f"🤨 '{input_path}' doesn't look like a .knda file.")
+    safe_print("[tip] Kinda source files end in .knda (e.g. hello.py.knda)")
+    return False
+
+
+def detect_language(path: Union[str, os.PathLike], forced: Union[str, None]) -> str:
     """
     Detect target language from file extension or --lang override.
     Currently only Python is fully supported.
     """
     if forced:
-        if forced.lower() == "c":
+        forced = forced.lower()
+        if forced == "c":
             # Reject C explicitly with helpful message
             safe_print("[note] C transpiler is planned for v0.4.0 but not ready yet!")
             safe_print("[info] Currently only Python is supported.")
@@ -346,12 +410,13 @@ def detect_language(path: Path, forced: Union[str, None]) -> str:
                 "[link] Track C support progress: https://github.com/kinda-lang/kinda-lang/issues/19"
             )
             raise ValueError("C language not yet supported")
-        return forced.lower()
+        return forced
 
-    name = str(path)
-    if name.endswith(".py.knda") or name.endswith(".py"):
+    # CLI callers pass plain strings, so fspath() is a no-op on the common path
+    name = os.fspath(path)
+    if name.endswith((".py.knda", ".py")):
         return "python"
-    elif name.endswith(".c.knda") or name.endswith(".c"):
+    elif name.endswith((".c.knda", ".c")):
         # C files not supported yet - reject with helpful message
         safe_print("[note] C files detected but C transpiler isn't ready yet!")
         safe_print("[info] C support is planned for v0.4.0 with full compilation pipeline")
@@ -363,13 +428,42 @@ def detect_language(path: Path, forced: Union[str, None]) -> str:
     return "python"
 
 
-def main(argv=None) -> int:
-    argv = argv or sys.argv[1:]
-    parser = argparse.ArgumentParser(
-        prog="kinda", description="A programming language for people who aren't totally sure"
-    )
-    sub = parser.add_subparsers(dest="command", required=True)
+def _run_transformed(path) -> None:
+    """
+    Execute a transformed .py file as __main__.
+    Compiles and execs it directly instead of going through runpy, which drags
+    in a couple dozen extra modules just to run one file. Like runpy, the code runs
+    in a fresh __main__ module installed in sys.modules with sys.argv[0] set to the
+    file, so pickling its own classes works; both are restored afterwards.
+    """
+    path = os.fspath(path)
+    with open(path, "rb") as f:
+        source = f.read()
+    code = compile(source, path, "exec")
+
+    module = ModuleType("__main__")
+    module.__file__ = path
+    old_main = sys.modules.get("__main__")
+    old_argv0 = sys.argv[0] if sys.argv else None
+    sys.modules["__main__"] = module
+    if sys.argv:
+        sys.argv[0] = path
+    else:
+        sys.argv.append(path)
+    try:
+        exec(code, module.__dict__)
+    finally:
+        if old_main is None:
+            sys.modules.pop("__main__", None)
+        else:
+            sys.modules["__main__"] = old_main
+        if old_argv0 is None:
+            sys.argv.clear()
+        else:
+            sys.argv[0] = old_argv0
 
+
+def _add_transform_parser(sub) -> None:
     p_transform = sub.add_parser(
         "transform", help="Turn your kinda code into actual code (how responsible of you)"
     )
@@ -397,6 +491,8 @@ def main(argv=None) -> int:
         help="Random seed for reproducible chaos (overrides KINDA_SEED environment variable)",
     )
 
+
+def _add_run_parser(sub) -> None:
     p_run = sub.add_parser("run", help="Transform then execute (living dangerously, I see)")
     p_run.add_argument("input", help="The .knda file you want to run")
     p_run.add_argument("--lang", default=None, help="Target language (currently: 'python' only)")
@@ -417,6 +513,8 @@ def main(argv=None) -> int:
         help="Random seed for reproducible chaos (overrides KINDA_SEED environment variable)",
     )
 
+
+def _add_interpret_parser(sub) -> None:
     p_interpret = sub.add_parser(
         "interpret", help="Run directly in fuzzy runtime (maximum chaos mode)"
     )
@@ -441,10 +539,16 @@ def main(argv=None) -> int:
         help="Random seed for reproducible chaos (overrides KINDA_SEED environment variable)",
     )
 
-    p_examples = sub.add_parser("examples", help="Show example kinda programs (for inspiration)")
 
-    p_syntax = sub.add_parser("syntax", help="Quick syntax reference (because you'll forget)")
+def _add_examples_parser(sub) -> None:
+    sub.add_parser("examples", help="Show example kinda programs (for inspiration)")
+
+
+def _add_syntax_parser(sub) -> None:
+    sub.add_parser("syntax", help="Quick syntax reference (because you'll forget)")
 
+
+def _add_record_parser(sub) -> None:
     # Record/replay commands for debugging
     p_record = sub.add_parser("record", help="Record execution for debugging and replay")
     record_sub = p_record.add_subparsers(dest="record_command", required=True)
@@ -477,6 +581,8 @@ def main(argv=None) -> int:
         help="Random seed for reproducible chaos (overrides KINDA_SEED environment variable)",
     )
 
+
+def _add_replay_parser(sub) -> None:
     # Replay command for exact execution reproduction
     p_replay = sub.add_parser("replay", help="Replay recorded sessions for debugging")
     p_replay.add_argument("session", help="The session.json file to replay")
@@ -489,6 +595,8 @@ def main(argv=None) -> int:
         help="Show detailed replay progress and validation info",
     )
 
+
+def _add_analyze_parser(sub) -> None:
     # Analyze command for session inspection and debugging
     p_analyze = sub.add_parser("analyze", help="Analyze recorded sessions for debugging insights")
     p_analyze.add_argument("session", help="The session.json file to analyze")
@@ -502,655 +610,771 @@ def main(argv=None) -> int:
     p_analyze.add_argument("--construct", "-c", help="Focus analysis on specific construct type")
     p_analyze.add_argument("--export", "-e", help="Export analysis to file (format: csv, json)")
 
-    args = parser.parse_args(argv)
 
-    if args.command == "transform":
-        # Setup personality for transform
-        setup_personality(
-            getattr(args, "mood", None),
-            getattr(args, "chaos_level", 5),
-            getattr(args, "seed", None),
-        )
+# Subcommand name -> function that registers its subparser (in --help listing order)
+_SUBPARSER_BUILDERS = {
+    "transform": _add_transform_parser,
+    "run": _add_run_parser,
+    "interpret": _add_interpret_parser,
+    "examples": _add_examples_parser,
+    "syntax": _add_syntax_parser,
+    "record": _add_record_parser,
+    "replay": _add_replay_parser,
+    "analyze": _add_analyze_parser,
+}
 
-        input_path = Path(args.input)
-        if not input_path.exists():
-            safe_print(f"[?] '{args.input}' doesn't exist. Are you sure you typed that right?")
-            safe_print("[tip] Tip: Check your file path and make sure the .knda file exists")
-            # Suggest similar files if possible
-            parent = input_path.parent
-            if parent.exists():
-                similar_files = list(parent.glob("*.knda"))
-                if similar_files:
-                    safe_print("📂 Found these .knda files in the same directory:")
-                    for f in similar_files[:3]:  # Show max 3 suggestions
-                        safe_print(f"   • {f.name}")
-            return 1
-        # Validate file before processing
-        if not validate_knda_file(input_path):
-            safe_print("💥 File validation failed - cannot process this file")
-            return 1
 
-        out_dir = Path(args.out)
-        try:
-            lang = detect_language(input_path, args.lang)
-        except ValueError as e:
-            # Language not supported (like C)
-            return 1
+def _sniff_subcommand(argv) -> Optional[str]:
+    """
+    Peek at argv for the subcommand so only its subparser has to be built.
+    The top-level parser takes no options of its own, so a valid invocation
+    always names the subcommand first. Returns None when it doesn't (e.g. --help).
+    """
+    if argv and argv[0] in _SUBPARSER_BUILDERS:
+        return argv[0]
+    return None
 
-        try:
-            transformer = get_transformer(lang)
-        except ValueError as e:
-            # Unsupported language
-            safe_print(f"[shrug] Sorry, I don't speak {lang} yet. Try Python maybe?")
-            return 1
 
-        if transformer is None:
-            safe_print(f"[shrug] Sorry, I don't speak {lang} yet. Try Python maybe?")
-            return 1
+@lru_cache(maxsize=None)
+def _build_parser(command: Optional[str] = None):
+    """
+    Build the CLI parser with just `command`'s subparser, or all of them if None.
+    Cached per command: parse_args() doesn't mutate the parser, so repeated main()
+    calls in one process (test suites) reuse it.
+    """
+    # Imported here so the print-only fast paths in main() never pay for argparse
+    import argparse
 
-        try:
-            output_paths = transformer.transform(input_path, out_dir=out_dir)
-            for path in output_paths:
-                print(f"* Transformed your chaos into: {path}")
-            print(f"* Generated {len(output_paths)} file(s). Hope they work!")
-            return 0
-        except Exception as e:
-            # Handle parsing errors gracefully
-            if "KindaParseError" in str(type(e)):
-                safe_print(str(e).strip())
-                safe_print("[tip] Fix the syntax error above and try again")
-            else:
-                safe_print(f"💥 Transform failed: {e}")
+    parser = argparse.ArgumentParser(
+        prog="kinda", description="A programming language for people who aren't totally sure"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
 
-                # Provide snarky but helpful suggestions based on error type
-                error_str = str(e).lower()
-                if "encoding" in error_str or "unicode" in error_str:
-                    safe_print(
-                        "[?] Your file has encoding issues. Fancy characters causing trouble?"
-                    )
-                    safe_print("   • Save as UTF-8 (like a civilized person)")
-                    safe_print("   • Those emojis might be breaking things 😅")
-                elif "permission" in error_str or "access" in error_str:
-                    safe_print("[shrug] Permission denied. The file system doesn't trust you:")
-                    safe_print(
-                        "   • Close the file if it's open elsewhere (multitasking gone wrong)"
-                    )
-                    safe_print("   • Check file permissions (maybe you don't own it?)")
-                elif "no such file" in error_str or "not found" in error_str:
-                    safe_print("[?] File not found. Did you type that path correctly?")
-                    safe_print("   • Double-check the path (typos are embarrassing)")
-                    safe_print("   • Make sure it ends with .knda (kinda important)")
-                else:
-                    safe_print("[shrug] Transform failed for mysterious reasons. Try:")
-                    safe_print("   • Fix any obvious syntax errors in your .knda file")
-                    safe_print("   • Remember: ~ before kinda constructs (seriously)")
-                    safe_print("   • Start with something simple first")
-            return 1
+    if command is not None:
+        _SUBPARSER_BUILDERS[command](sub)
+    else:
+        # No recognizable subcommand - build everything so help/errors list all commands
+        for add_subparser in _SUBPARSER_BUILDERS.values():
+            add_subparser(sub)
 
-    if args.command == "run":
-        # Setup personality for run
-        setup_personality(
-            getattr(args, "mood", None),
-            getattr(args, "chaos_level", 5),
-            getattr(args, "seed", None),
-        )
+    return parser
 
-        input_path = Path(args.input)
-        if not input_path.exists():
-            safe_print(f"[shrug]‍♂️ Can't find '{args.input}'. Did you make that up?")
-            safe_print("[tip] Double-check your file path - it should end with .knda")
-            # Suggest similar files
-            parent = input_path.parent
-            if parent.exists():
-                similar_files = list(parent.glob("*.knda"))
-                if similar_files:
-                    safe_print("📂 Found these runnable .knda files nearby:")
-                    for f in similar_files[:3]:  # Show max 3 suggestions
-                        safe_print(f"   • {f.name}")
-            return 1
-        # Validate file before processing
-        if not validate_knda_file(input_path):
-            safe_print("💥 File validation failed - cannot run this file")
-            return 1
 
-        try:
-            lang = detect_language(input_path, args.lang)
-        except ValueError as e:
-            # Language not supported (like C)
-            return 1
-        transformer = get_transformer(lang)
-        if transformer is None:
-            safe_print(f"🙄 Can't run {lang} files yet. Python works though.")
-            return 1
+# Options the hand-rolled parser understands: flag -> (dest, converter, default)
+_FAST_COMMON_OPTIONS = {
+    "--lang": ("lang", str, None),
+    "--mood": ("mood", str, None),
+    "--chaos-level": ("chaos_level", int, 5),
+    "--seed": ("seed", int, None),
+}
+_FAST_COMMANDS = {
+    "transform": dict(_FAST_COMMON_OPTIONS, **{"--out": ("out", str, "build")}),
+    "run": _FAST_COMMON_OPTIONS,
+    "interpret": _FAST_COMMON_OPTIONS,
+}
 
-        try:
-            out_dir = Path(".kinda-build")
-            out_paths = transformer.transform(input_path, out_dir=out_dir)
-            if lang == "python":
-                import runpy
 
-                safe_print("🎮 Running your questionable code...")
-                # Execute the transformed file
-                try:
-                    runpy.run_path(str(out_paths[0]), run_name="__main__")
-                    safe_print("🎉 Well, that didn't crash. Success?")
-                except Exception as e:
-                    safe_print(f"💥 Runtime error: {e}")
-                    safe_print("[?] Your code transformed fine but crashed during execution")
+def _fast_parse(argv):
+    """
+    Parse the everyday `kinda <command> <input> [--option value ...]` shapes without argparse.
+    Returns None for anything out of the ordinary (help flags, unknown options, bad values)
+    so argparse can take over and produce its usual messages.
+    """
+    options = _FAST_COMMANDS.get(argv[0]) if argv else None
+    if options is None:
+        return None
 
-                    # Provide snarky but helpful suggestions based on error type
-                    error_str = str(e).lower()
-                    if "invalid syntax" in error_str:
-                        safe_print(
-                            "[shrug] Well, that's syntactically questionable. Common kinda fails:"
-                        )
-                        safe_print(
-                            "   • Forgot the ~ tilde? maybe should be ~maybe (kinda important)"
-                        )
-                        safe_print("   • Mixing Python in .knda? That's... ambitious")
-                        safe_print("   • Missing semicolons? Some constructs are picky like that")
-                    elif "name" in error_str and "not defined" in error_str:
-                        safe_print("[?] That variable doesn't exist. Awkward. Try:")
-                        safe_print(
-                            "   • ~kinda int x = 42 to declare fuzzy variables (the ~ matters)"
-                        )
-                        safe_print(
-                            "   • Double-check your spelling (typos happen to the best of us)"
-                        )
-                    elif "module" in error_str and "not found" in error_str:
-                        safe_print("[?] Python can't find that module. Oops:")
-                        safe_print(
-                            "   • Don't import kinda stuff in regular Python (that won't work)"
-                        )
-                        safe_print("   • Make sure all your dependencies are installed")
-                    else:
-                        safe_print("[shrug] Something's broken. The usual suspects:")
-                        safe_print("   • Missing ~ before kinda constructs (very important)")
-                        safe_print("   • General syntax weirdness")
-                    return 1
-                return 0
-            safe_print(f"😅 I can transform {lang} but can't run it. Try 'transform' instead?")
-            return 1
-        except Exception as e:
-            # Handle parsing errors gracefully
-            if "KindaParseError" in str(type(e)):
-                safe_print(str(e).strip())
-                safe_print("[tip] Fix the syntax error above and try again")
-            else:
-                safe_print(f"💥 Transform failed: {e}")
-                safe_print("[tip] Check your .knda file for syntax issues")
-            return 1
+    values = {dest: default for dest, _, default in options.values()}
+    values["command"] = argv[0]
+    positional = []
+
+    i = 1
+    while i < len(argv):
+        token = argv[i]
+        if token.startswith("-"):
+            flag, has_value, value = token.partition("=")
+            spec = options.get(flag)
+            if spec is None:
+                return None
+            if not has_value:
+                i += 1
+                if i >= len(argv) or argv[i].startswith("--"):
+                    return None
+                value = argv[i]
+            dest, convert, _ = spec
+            try:
+                values[dest] = convert(value)
+            except ValueError:
+                return None
+        else:
+            positional.append(token)
+        i += 1
 
-    if args.command == "interpret":
-        # Setup personality for interpret
-        setup_personality(
-            getattr(args, "mood", None),
-            getattr(args, "chaos_level", 5),
-            getattr(args, "seed", None),
-        )
+    if len(positional) != 1 or not 1 <= values["chaos_level"] <= 10:
+        return None
+    values["input"] = positional[0]
+    return SimpleNamespace(**values)
 
-        input_path = Path(args.input)
-        if not input_path.exists():
-            safe_print(f"🙃 '{args.input}' is nowhere to be found. Try again?")
-            safe_print("[tip] Make sure your .knda file exists and the path is correct")
-            # Suggest similar files
-            parent = input_path.parent
-            if parent.exists():
-                similar_files = list(parent.glob("*.knda"))
-                if similar_files:
-                    safe_print("📂 These .knda files are available for interpretation:")
-                    for f in similar_files[:3]:  # Show max 3 suggestions
-                        safe_print(f"   • {f.name}")
-            return 1
-        # Validate file before processing
-        if not validate_knda_file(input_path):
-            safe_print("💥 File validation failed - cannot interpret this file")
-            return 1
 
-        try:
-            lang = detect_language(input_path, args.lang)
-        except ValueError as e:
-            # Language not supported (like C)
-            return 1
-        if lang == "python":
-            from kinda.interpreter.repl import run_interpreter
+def _cmd_transform(args) -> int:
+    """Transform a .knda file (or directory) into Python."""
+    # Setup personality for transform
+    setup_personality(
+        getattr(args, "mood", None),
+        getattr(args, "chaos_level", 5),
+        getattr(args, "seed", None),
+    )
 
-            safe_print("🔮 Entering the chaos dimension...")
-            run_interpreter(str(input_path), lang)
-            safe_print("🌪️ Chaos complete. Reality may have shifted slightly.")
-            return 0
-        safe_print(f"🤨 Interpret mode only works with Python. What are you even trying to do?")
+    input_path = args.input
+    if not os.path.exists(input_path):
+        safe_print(f"[?] '{args.input}' doesn't exist. Are you sure you typed that right?")
+        safe_print("[tip] Tip: Check your file path and make sure the .knda file exists")
+        _suggest_similar_files(args.input, "📂 Found these .knda files in the same directory:")
+        return 1
+    # Cheap extension check before reading the file or importing the transformer
+    if not _looks_like_knda(input_path):
+        return 1
+    # Validate file before processing
+    if not validate_knda_file(input_path):
+        safe_print("💥 File validation failed - cannot process this file")
         return 1
 
-    if args.command == "record":
-        if args.record_command == "run":
-            # Setup personality for record run
-            setup_personality(
-                getattr(args, "mood", None),
-                getattr(args, "chaos_level", 5),
-                getattr(args, "seed", None),
-            )
+    try:
+        lang = detect_language(input_path, args.lang)
+    except ValueError as e:
+        # Language not supported (like C)
+        return 1
 
-            input_path = Path(args.input)
-            if not input_path.exists():
-                safe_print(f"[?] Can't find '{args.input}' to record. Did you spell that right?")
-                safe_print("[tip] Make sure your .knda file exists and the path is correct")
-                return 1
+    try:
+        transformer = get_transformer(lang)
+    except ValueError as e:
+        # Unsupported language
+        safe_print(f"[shrug] Sorry, I don't speak {lang} yet. Try Python maybe?")
+        return 1
 
-            # Validate file before processing
-            if not validate_knda_file(input_path):
-                safe_print("💥 File validation failed - cannot record this file")
-                return 1
+    if transformer is None:
+        safe_print(f"[shrug] Sorry, I don't speak {lang} yet. Try Python maybe?")
+        return 1
 
-            # Determine output file path
-            if args.output:
-                output_path = Path(args.output)
+    try:
+        output_paths = transformer.transform(input_path, out_dir=args.out)
+        # One write for the whole report rather than one per output file
+        report = [f"* Transformed your chaos into: {path}" for path in output_paths]
+        report.append(f"* Generated {len(output_paths)} file(s). Hope they work!")
+        print("\n".join(report))
+        return 0
+    except Exception as e:
+        # Handle parsing errors gracefully
+        if "KindaParseError" in str(type(e)):
+            safe_print(str(e).strip())
+            safe_print("[tip] Fix the syntax error above and try again")
+        else:
+            safe_print(f"💥 Transform failed: {e}")
+
+            # Provide snarky but helpful suggestions based on error type
+            error_str = str(e).lower()
+            if "encoding" in error_str or "unicode" in error_str:
+                safe_print("[?] Your file has encoding issues. Fancy characters causing trouble?")
+                safe_print("   • Save as UTF-8 (like a civilized person)")
+                safe_print("   • Those emojis might be breaking things 😅")
+            elif "permission" in error_str or "access" in error_str:
+                safe_print("[shrug] Permission denied. The file system doesn't trust you:")
+                safe_print("   • Close the file if it's open elsewhere (multitasking gone wrong)")
+                safe_print("   • Check file permissions (maybe you don't own it?)")
+            elif "no such file" in error_str or "not found" in error_str:
+                safe_print("[?] File not found. Did you type that path correctly?")
+                safe_print("   • Double-check the path (typos are embarrassing)")
+                safe_print("   • Make sure it ends with .knda (kinda important)")
             else:
-                output_path = input_path.parent / f"{input_path.stem}.session.json"
+                safe_print("[shrug] Transform failed for mysterious reasons. Try:")
+                safe_print("   • Fix any obvious syntax errors in your .knda file")
+                safe_print("   • Remember: ~ before kinda constructs (seriously)")
+                safe_print("   • Start with something simple first")
+        return 1
+
 
+def _cmd_run(args) -> int:
+    """Transform a .knda file and execute the result."""
+    # Setup personality for run
+    setup_personality(
+        getattr(args, "mood", None),
+        getattr(args, "chaos_level", 5),
+        getattr(args, "seed", None),
+    )
+
+    input_path = args.input
+    if not os.path.exists(input_path):
+        safe_print(f"[shrug]‍♂️ Can't find '{args.input}'. Did you make that up?")
+        safe_print("[tip] Double-check your file path - it should end with .knda")
+        _suggest_similar_files(args.input, "📂 Found these runnable .knda files nearby:")
+        return 1
+    # Cheap extension check before reading the file or importing the transformer
+    if not _looks_like_knda(input_path):
+        return 1
+    # Validate file before processing
+    if not validate_knda_file(input_path):
+        safe_print("💥 File validation failed - cannot run this file")
+        return 1
+
+    try:
+        lang = detect_language(input_path, args.lang)
+    except ValueError as e:
+        # Language not supported (like C)
+        return 1
+    transformer = get_transformer(lang)
+    if transformer is None:
+        safe_print(f"🙄 Can't run {lang} files yet. Python works though.")
+        return 1
+
+    try:
+        out_paths = transformer.transform(input_path, out_dir=".kinda-build")
+        if lang == "python":
+            safe_print("🎮 Running your questionable code...")
+            # Execute the transformed file
             try:
-                lang = detect_language(input_path, args.lang)
-            except ValueError as e:
-                # Language not supported (like C)
-                return 1
+                _run_transformed(out_paths[0])
+                safe_print("🎉 Well, that didn't crash. Success?")
+            except Exception as e:
+                safe_print(f"💥 Runtime error: {e}")
+                safe_print("[?] Your code transformed fine but crashed during execution")
 
-            transformer = get_transformer(lang)
-            if transformer is None:
-                safe_print(f"🙄 Can't record {lang} files yet. Python works though.")
+                # Provide snarky but helpful suggestions based on error type
+                error_str = str(e).lower()
+                if "invalid syntax" in error_str:
+                    safe_print(
+                        "[shrug] Well, that's syntactically questionable. Common kinda fails:"
+                    )
+                    safe_print("   • Forgot the ~ tilde? maybe should be ~maybe (kinda important)")
+                    safe_print("   • Mixing Python in .knda? That's... ambitious")
+                    safe_print("   • Missing semicolons? Some constructs are picky like that")
+                elif "name" in error_str and "not defined" in error_str:
+                    safe_print("[?] That variable doesn't exist. Awkward. Try:")
+                    safe_print("   • ~kinda int x = 42 to declare fuzzy variables (the ~ matters)")
+                    safe_print("   • Double-check your spelling (typos happen to the best of us)")
+                elif "module" in error_str and "not found" in error_str:
+                    safe_print("[?] Python can't find that module. Oops:")
+                    safe_print("   • Don't import kinda stuff in regular Python (that won't work)")
+                    safe_print("   • Make sure all your dependencies are installed")
+                else:
+                    safe_print("[shrug] Something's broken. The usual suspects:")
+                    safe_print("   • Missing ~ before kinda constructs (very important)")
+                    safe_print("   • General syntax weirdness")
                 return 1
+            return 0
+        safe_print(f"😅 I can transform {lang} but can't run it. Try 'transform' instead?")
+        return 1
+    except Exception as e:
+        # Handle parsing errors gracefully
+        if "KindaParseError" in str(type(e)):
+            safe_print(str(e).strip())
+            safe_print("[tip] Fix the syntax error above and try again")
+        else:
+            safe_print(f"💥 Transform failed: {e}")
+            safe_print("[tip] Check your .knda file for syntax issues")
+        return 1
 
-            if lang == "python":
-                from kinda.record_replay import start_recording, stop_recording
-                import runpy
 
-                try:
-                    # Start recording
-                    safe_print("🎥 Starting recording session...")
-                    command_args = sys.argv[1:]  # Store original command for session
-                    session_id = start_recording(str(input_path), command_args, output_path)
-                    safe_print(f"📼 Session ID: {session_id}")
-
-                    # Transform and execute the program
-                    out_dir = Path(".kinda-build")
-                    out_paths = transformer.transform(input_path, out_dir=out_dir)
-
-                    safe_print("🎮 Running and recording your questionable code...")
-
-                    try:
-                        # Execute the transformed file while recording
-                        runpy.run_path(str(out_paths[0]), run_name="__main__")
-                        safe_print("🎉 Execution complete! Recording captured.")
-
-                    except Exception as e:
-                        safe_print(f"💥 Runtime error during recording: {e}")
-                        safe_print("[info] Recording captured up to the point of failure")
-
-                    finally:
-                        # Always stop recording and save session
-                        session = stop_recording()
-                        safe_print(f"💾 Session saved to: {output_path}")
-                        safe_print(
-                            f"📊 Recorded {session.total_calls} RNG calls in {session.duration:.3f}s"
-                        )
+def _cmd_interpret(args) -> int:
+    """Run a .knda file directly in the fuzzy runtime."""
+    # Setup personality for interpret
+    setup_personality(
+        getattr(args, "mood", None),
+        getattr(args, "chaos_level", 5),
+        getattr(args, "seed", None),
+    )
 
-                        # Show summary of what was recorded
-                        if session.construct_usage:
-                            safe_print("🎯 Constructs recorded:")
-                            for construct, count in sorted(session.construct_usage.items()):
-                                safe_print(f"   • {construct}: {count} calls")
+    input_path = args.input
+    if not os.path.exists(input_path):
+        safe_print(f"🙃 '{args.input}' is nowhere to be found. Try again?")
+        safe_print("[tip] Make sure your .knda file exists and the path is correct")
+        _suggest_similar_files(args.input, "📂 These .knda files are available for interpretation:")
+        return 1
+    # Cheap extension check before reading the file or importing the transformer
+    if not _looks_like_knda(input_path):
+        return 1
+    # Validate file before processing
+    if not validate_knda_file(input_path):
+        safe_print("💥 File validation failed - cannot interpret this file")
+        return 1
 
-                        return 0
+    try:
+        lang = detect_language(input_path, args.lang)
+    except ValueError as e:
+        # Language not supported (like C)
+        return 1
+    if lang == "python":
+        # Reuse the already-imported module when main() runs repeatedly in one process
+        repl = sys.modules.get("kinda.interpreter.repl")
+        if repl is None:
+            from kinda.interpreter import repl
+
+        safe_print("🔮 Entering the chaos dimension...")
+        repl.run_interpreter(input_path, lang)
+        safe_print("🌪️ Chaos complete. Reality may have shifted slightly.")
+        return 0
+    safe_print(f"🤨 Interpret mode only works with Python. What are you even trying to do?")
+    return 1
 
-                except Exception as e:
-                    safe_print(f"💥 Recording failed: {e}")
-                    safe_print("[tip] Check that your .knda file is syntactically correct")
-                    return 1
-            else:
-                safe_print(f"😅 Recording is only supported for Python programs currently")
-                return 1
 
-    if args.command == "replay":
-        # Replay recorded session
-        session_path = Path(args.session)
-        program_path = Path(args.program)
+def _cmd_record(args) -> int:
+    """Record a program's execution to a session file."""
+    from pathlib import Path
 
-        if not session_path.exists():
-            safe_print(
-                f"[?] Can't find session file '{args.session}'. Did you record this session?"
-            )
-            safe_print("[tip] Use 'kinda record run' to create a session file first")
-            return 1
+    if args.record_command == "run":
+        # Setup personality for record run
+        setup_personality(
+            getattr(args, "mood", None),
+            getattr(args, "chaos_level", 5),
+            getattr(args, "seed", None),
+        )
 
-        if not program_path.exists():
-            safe_print(f"[?] Can't find program file '{args.program}'. Did you move it?")
-            safe_print("[tip] Make sure the .knda file exists and matches the recorded session")
+        input_path = Path(args.input)
+        if not input_path.exists():
+            safe_print(f"[?] Can't find '{args.input}' to record. Did you spell that right?")
+            safe_print("[tip] Make sure your .knda file exists and the path is correct")
             return 1
 
         # Validate file before processing
-        if not validate_knda_file(program_path):
-            safe_print("💥 File validation failed - cannot replay this file")
+        if not validate_knda_file(input_path):
+            safe_print("💥 File validation failed - cannot record this file")
             return 1
 
+        # Determine output file path
+        if args.output:
+            output_path = Path(args.output)
+        else:
+            output_path = input_path.parent / f"{input_path.stem}.session.json"
+
         try:
-            lang = detect_language(program_path, args.lang)
+            lang = detect_language(input_path, args.lang)
         except ValueError as e:
             # Language not supported (like C)
             return 1
 
         transformer = get_transformer(lang)
         if transformer is None:
-            safe_print(f"🙄 Can't replay {lang} files yet. Python works though.")
+            safe_print(f"🙄 Can't record {lang} files yet. Python works though.")
             return 1
 
         if lang == "python":
-            from kinda.record_replay import ExecutionRecorder, start_replay, stop_replay
-            import runpy
+            from kinda.record_replay import start_recording, stop_recording
 
             try:
-                # Load the recorded session
-                safe_print(f"📂 Loading session from: {session_path}")
-                session = ExecutionRecorder.load_session(session_path)
-                safe_print(f"🎭 Original session: {session.session_id}")
-                safe_print(f"📅 Recorded: {session.start_time} ({session.total_calls} RNG calls)")
-
-                # Verify session matches program
-                if session.input_file != str(program_path):
-                    safe_print(
-                        f"⚠️  Session was recorded for '{session.input_file}', replaying '{program_path}'"
-                    )
-                    safe_print("[info] This may cause replay mismatches if files differ")
-
-                # Start replay engine
-                safe_print("🔄 Starting deterministic replay...")
-                replay_session_id = start_replay(session)
+                # Start recording
+                safe_print("🎥 Starting recording session...")
+                command_args = sys.argv[1:]  # Store original command for session
+                session_id = start_recording(str(input_path), command_args, output_path)
+                safe_print(f"📼 Session ID: {session_id}")
 
                 # Transform and execute the program
-                out_dir = Path(".kinda-build")
-                out_paths = transformer.transform(program_path, out_dir=out_dir)
+                out_paths = transformer.transform(input_path, out_dir=".kinda-build")
 
-                safe_print("🎮 Replaying your questionable code with recorded decisions...")
+                safe_print("🎮 Running and recording your questionable code...")
 
                 try:
-                    # Execute the transformed file with replay active
-                    runpy.run_path(str(out_paths[0]), run_name="__main__")
-                    safe_print("🎉 Replay complete! Execution was deterministic.")
+                    # Execute the transformed file while recording
+                    _run_transformed(out_paths[0])
+                    safe_print("🎉 Execution complete! Recording captured.")
 
                 except Exception as e:
-                    safe_print(f"💥 Runtime error during replay: {e}")
-                    safe_print("[info] This may indicate a difference from the original execution")
+                    safe_print(f"💥 Runtime error during recording: {e}")
+                    safe_print("[info] Recording captured up to the point of failure")
 
                 finally:
-                    # Always stop replay and show statistics
-                    replay_stats = stop_replay()
-                    safe_print(f"📊 Replay Statistics:")
-                    safe_print(f"   • Total calls: {replay_stats['total_calls']}")
-                    safe_print(f"   • Calls replayed: {replay_stats['calls_replayed']}")
-                    safe_print(f"   • Success rate: {replay_stats['success_rate']:.1f}%")
-
-                    if replay_stats["validation_issues"] > 0:
-                        safe_print(
-                            f"   ⚠️  {replay_stats['validation_issues']} validation issues detected"
-                        )
-                        if args.verbose:
-                            for i, mismatch in enumerate(
-                                replay_stats["mismatches"][:5]
-                            ):  # Show first 5
-                                safe_print(
-                                    f"      {i+1}. {mismatch['reason']} at call {mismatch['call_index']}"
-                                )
-
-                    if replay_stats["replay_complete"]:
-                        safe_print("✅ Replay completed successfully - all recorded calls matched")
-                    else:
-                        safe_print("⚠️  Replay incomplete - execution path may have diverged")
+                    # Always stop recording and save session
+                    session = stop_recording()
+                    safe_print(f"💾 Session saved to: {output_path}")
+                    safe_print(
+                        f"📊 Recorded {session.total_calls} RNG calls in {session.duration:.3f}s"
+                    )
+
+                    # Show summary of what was recorded
+                    if session.construct_usage:
+                        safe_print("🎯 Constructs recorded:")
+                        for construct, count in sorted(session.construct_usage.items()):
+                            safe_print(f"   • {construct}: {count} calls")
 
                     return 0
 
             except Exception as e:
-                safe_print(f"💥 Replay failed: {e}")
-                safe_print(
-                    "[tip] Make sure the session file is valid and the program hasn't changed"
-                )
+                safe_print(f"💥 Recording failed: {e}")
+                safe_print("[tip] Check that your .knda file is syntactically correct")
                 return 1
         else:
-            safe_print(f"😅 Replay is only supported for Python programs currently")
+            safe_print(f"😅 Recording is only supported for Python programs currently")
             return 1
 
-    if args.command == "analyze":
-        # Analyze recorded session
-        session_path = Path(args.session)
+    return 1
 
-        if not session_path.exists():
-            safe_print(
-                f"[?] Can't find session file '{args.session}'. Did you record this session?"
-            )
-            safe_print("[tip] Use 'kinda record run' to create a session file first")
-            return 1
 
-        try:
-            from kinda.record_replay import ExecutionRecorder
+def _cmd_replay(args) -> int:
+    """Replay a program against a recorded session."""
+    from pathlib import Path
 
-            # Load the session
-            safe_print(f"📂 Loading session from: {session_path}")
-            session = ExecutionRecorder.load_session(session_path)
+    # Replay recorded session
+    session_path = Path(args.session)
+    program_path = Path(args.program)
 
-            # Generate analysis based on format
-            if args.format == "json":
-                # Output raw JSON
-                import json
+    if not session_path.exists():
+        safe_print(f"[?] Can't find session file '{args.session}'. Did you record this session?")
+        safe_print("[tip] Use 'kinda record run' to create a session file first")
+        return 1
 
-                session_dict = {
-                    "session_id": session.session_id,
-                    "input_file": session.input_file,
-                    "start_time": session.start_time,
-                    "duration": session.duration,
-                    "total_calls": session.total_calls,
-                    "construct_usage": session.construct_usage,
-                    "initial_personality": session.initial_personality,
-                    "rng_calls": [
-                        {
-                            "sequence_number": call.sequence_number,
-                            "method_name": call.method_name,
-                            "args": call.args,
-                            "result": call.result,
-                            "construct_type": call.construct_type,
-                            "decision_impact": call.decision_impact,
-                        }
-                        for call in session.rng_calls
-                    ],
-                }
-                print(json.dumps(session_dict, indent=2))
+    if not program_path.exists():
+        safe_print(f"[?] Can't find program file '{args.program}'. Did you move it?")
+        safe_print("[tip] Make sure the .knda file exists and matches the recorded session")
+        return 1
+
+    # Validate file before processing
+    if not validate_knda_file(program_path):
+        safe_print("💥 File validation failed - cannot replay this file")
+        return 1
+
+    try:
+        lang = detect_language(program_path, args.lang)
+    except ValueError as e:
+        # Language not supported (like C)
+        return 1
+
+    transformer = get_transformer(lang)
+    if transformer is None:
+        safe_print(f"🙄 Can't replay {lang} files yet. Python works though.")
+        return 1
 
-            elif args.format == "summary":
-                # Show session summary
-                safe_print(f"🎭 Session Analysis: {session.session_id}")
-                safe_print(f"📁 Program: {session.input_file}")
+    if lang == "python":
+        from kinda.record_replay import ExecutionRecorder, start_replay, stop_replay
+
+        try:
+            # Load the recorded session
+            safe_print(f"📂 Loading session from: {session_path}")
+            session = ExecutionRecorder.load_session(session_path)
+            safe_print(f"🎭 Original session: {session.session_id}")
+            safe_print(f"📅 Recorded: {session.start_time} ({session.total_calls} RNG calls)")
+
+            # Verify session matches program
+            if session.input_file != str(program_path):
                 safe_print(
-                    f"⏱️  Duration: {session.duration:.3f}s ({session.total_calls} RNG calls)"
+                    f"⚠️  Session was recorded for '{session.input_file}', replaying '{program_path}'"
                 )
-                safe_print(f"🎲 Initial Personality: {session.initial_personality}")
-
-                if session.construct_usage:
-                    safe_print("\n🎯 Construct Usage:")
-                    total_calls = sum(session.construct_usage.values())
-                    for construct, count in sorted(
-                        session.construct_usage.items(), key=lambda x: x[1], reverse=True
-                    ):
-                        percentage = (count / total_calls * 100) if total_calls > 0 else 0
-                        safe_print(f"   • {construct}: {count} calls ({percentage:.1f}%)")
-
-                    # Show most impactful constructs
-                    if len(session.construct_usage) > 1:
-                        top_construct = max(session.construct_usage.items(), key=lambda x: x[1])
-                        safe_print(
-                            f"\n💫 Most Active Construct: {top_construct[0]} ({top_construct[1]} calls)"
-                        )
+                safe_print("[info] This may cause replay mismatches if files differ")
 
-            elif args.format == "detailed":
-                # Show detailed call-by-call analysis
-                safe_print(f"🔍 Detailed Session Analysis: {session.session_id}")
-                safe_print(f"📁 Program: {session.input_file}")
-                safe_print(f"⏱️  Duration: {session.duration:.3f}s")
+            # Start replay engine
+            safe_print("🔄 Starting deterministic replay...")
+            replay_session_id = start_replay(session)
 
-                safe_print(f"\n📋 RNG Call Timeline ({session.total_calls} calls):")
+            # Transform and execute the program
+            out_paths = transformer.transform(program_path, out_dir=".kinda-build")
 
-                construct_filter = args.construct
-                displayed_calls = 0
+            safe_print("🎮 Replaying your questionable code with recorded decisions...")
 
-                for i, call in enumerate(session.rng_calls[:50]):  # Limit to first 50 calls
-                    if construct_filter and call.construct_type != construct_filter:
-                        continue
+            try:
+                # Execute the transformed file with replay active
+                _run_transformed(out_paths[0])
+                safe_print("🎉 Replay complete! Execution was deterministic.")
 
+            except Exception as e:
+                safe_print(f"💥 Runtime error during replay: {e}")
+                safe_print("[info] This may indicate a difference from the original execution")
+
+            finally:
+                # Always stop replay and show statistics
+                replay_stats = stop_replay()
+                safe_print(f"📊 Replay Statistics:")
+                safe_print(f"   • Total calls: {replay_stats['total_calls']}")
+                safe_print(f"   • Calls replayed: {replay_stats['calls_replayed']}")
+                safe_print(f"   • Success rate: {replay_stats['success_rate']:.1f}%")
+
+                if replay_stats["validation_issues"] > 0:
                     safe_print(
-                        f"   {call.sequence_number:3d}. {call.method_name}({', '.join(map(str, call.args))}) → {call.result}"
+                        f"   ⚠️  {replay_stats['validation_issues']} validation issues detected"
                     )
-                    if call.construct_type:
-                        safe_print(f"        📍 {call.construct_type}: {call.decision_impact}")
-                    displayed_calls += 1
+                    if args.verbose:
+                        for i, mismatch in enumerate(
+                            replay_stats["mismatches"][:5]
+                        ):  # Show first 5
+                            safe_print(
+                                f"      {i+1}. {mismatch['reason']} at call {mismatch['call_index']}"
+                            )
+
+                if replay_stats["replay_complete"]:
+                    safe_print("✅ Replay completed successfully - all recorded calls matched")
+                else:
+                    safe_print("⚠️  Replay incomplete - execution path may have diverged")
+
+                return 0
 
-                if len(session.rng_calls) > 50:
-                    safe_print(f"   ... and {len(session.rng_calls) - 50} more calls")
+        except Exception as e:
+            safe_print(f"💥 Replay failed: {e}")
+            safe_print("[tip] Make sure the session file is valid and the program hasn't changed")
+            return 1
+    else:
+        safe_print(f"😅 Replay is only supported for Python programs currently")
+        return 1
 
-                if construct_filter:
-                    safe_print(f"\n🎯 Showing calls for construct: {construct_filter}")
-                    safe_print(f"📊 {displayed_calls} matching calls found")
 
-            elif args.format == "constructs":
-                # Focus on construct analysis
-                safe_print(f"🎯 Construct Analysis: {session.session_id}")
-                safe_print(f"📁 Program: {session.input_file}")
+def _cmd_analyze(args) -> int:
+    """Summarize or export a recorded session."""
+    from pathlib import Path
 
-                if not session.construct_usage:
-                    safe_print("🤔 No construct usage detected in this session")
-                    return 0
+    # Analyze recorded session
+    session_path = Path(args.session)
 
-                safe_print(f"\n📊 Construct Breakdown ({session.total_calls} total calls):")
+    if not session_path.exists():
+        safe_print(f"[?] Can't find session file '{args.session}'. Did you record this session?")
+        safe_print("[tip] Use 'kinda record run' to create a session file first")
+        return 1
 
+    try:
+        from kinda.record_replay import ExecutionRecorder
+
+        # Load the session
+        safe_print(f"📂 Loading session from: {session_path}")
+        session = ExecutionRecorder.load_session(session_path)
+
+        # Generate analysis based on format
+        if args.format == "json":
+            # Output raw JSON
+            import json
+
+            session_dict = {
+                "session_id": session.session_id,
+                "input_file": session.input_file,
+                "start_time": session.start_time,
+                "duration": session.duration,
+                "total_calls": session.total_calls,
+                "construct_usage": session.construct_usage,
+                "initial_personality": session.initial_personality,
+                "rng_calls": [
+                    {
+                        "sequence_number": call.sequence_number,
+                        "method_name": call.method_name,
+                        "args": call.args,
+                        "result": call.result,
+                        "construct_type": call.construct_type,
+                        "decision_impact": call.decision_impact,
+                    }
+                    for call in session.rng_calls
+                ],
+            }
+            print(json.dumps(session_dict, indent=2))
+
+        elif args.format == "summary":
+            # Show session summary
+            safe_print(f"🎭 Session Analysis: {session.session_id}")
+            safe_print(f"📁 Program: {session.input_file}")
+            safe_print(f"⏱️  Duration: {session.duration:.3f}s ({session.total_calls} RNG calls)")
+            safe_print(f"🎲 Initial Personality: {session.initial_personality}")
+
+            if session.construct_usage:
+                safe_print("\n🎯 Construct Usage:")
+                total_calls = sum(session.construct_usage.values())
                 for construct, count in sorted(
                     session.construct_usage.items(), key=lambda x: x[1], reverse=True
                 ):
-                    percentage = (
-                        (count / session.total_calls * 100) if session.total_calls > 0 else 0
+                    percentage = (count / total_calls * 100) if total_calls > 0 else 0
+                    safe_print(f"   • {construct}: {count} calls ({percentage:.1f}%)")
+
+                # Show most impactful constructs
+                if len(session.construct_usage) > 1:
+                    top_construct = max(session.construct_usage.items(), key=lambda x: x[1])
+                    safe_print(
+                        f"\n💫 Most Active Construct: {top_construct[0]} ({top_construct[1]} calls)"
                     )
-                    safe_print(f"\n🎲 {construct.upper()}: {count} calls ({percentage:.1f}%)")
-
-                    # Find example calls for this construct
-                    examples = [
-                        call for call in session.rng_calls if call.construct_type == construct
-                    ][:3]
-                    if examples:
-                        safe_print("   Examples:")
-                        for example in examples:
-                            safe_print(
-                                f"     • {example.method_name}({', '.join(map(str, example.args))}) → {example.result}"
-                            )
-                            if example.decision_impact:
-                                safe_print(f"       Impact: {example.decision_impact}")
 
-            elif args.format == "timeline":
-                # Show execution timeline
-                safe_print(f"📈 Execution Timeline: {session.session_id}")
-                safe_print(f"📁 Program: {session.input_file}")
+        elif args.format == "detailed":
+            # Show detailed call-by-call analysis
+            safe_print(f"🔍 Detailed Session Analysis: {session.session_id}")
+            safe_print(f"📁 Program: {session.input_file}")
+            safe_print(f"⏱️  Duration: {session.duration:.3f}s")
 
-                if not session.rng_calls:
-                    safe_print("🤔 No RNG calls recorded in this session")
-                    return 0
+            safe_print(f"\n📋 RNG Call Timeline ({session.total_calls} calls):")
+
+            construct_filter = args.construct
+            displayed_calls = 0
+
+            for i, call in enumerate(session.rng_calls[:50]):  # Limit to first 50 calls
+                if construct_filter and call.construct_type != construct_filter:
+                    continue
+
+                safe_print(
+                    f"   {call.sequence_number:3d}. {call.method_name}({', '.join(map(str, call.args))}) → {call.result}"
+                )
+                if call.construct_type:
+                    safe_print(f"        📍 {call.construct_type}: {call.decision_impact}")
+                displayed_calls += 1
+
+            if len(session.rng_calls) > 50:
+                safe_print(f"   ... and {len(session.rng_calls) - 50} more calls")
+
+            if construct_filter:
+                safe_print(f"\n🎯 Showing calls for construct: {construct_filter}")
+                safe_print(f"📊 {displayed_calls} matching calls found")
+
+        elif args.format == "constructs":
+            # Focus on construct analysis
+            safe_print(f"🎯 Construct Analysis: {session.session_id}")
+            safe_print(f"📁 Program: {session.input_file}")
+
+            if not session.construct_usage:
+                safe_print("🤔 No construct usage detected in this session")
+                return 0
 
-                # Group calls by construct type over time
-                time_buckets = {}
-                start_time = session.rng_calls[0].timestamp
+            safe_print(f"\n📊 Construct Breakdown ({session.total_calls} total calls):")
 
-                for call in session.rng_calls:
-                    elapsed = call.timestamp - start_time
-                    bucket = int(elapsed * 10) / 10  # 0.1s buckets
-                    construct = call.construct_type or "unknown"
+            for construct, count in sorted(
+                session.construct_usage.items(), key=lambda x: x[1], reverse=True
+            ):
+                percentage = (count / session.total_calls * 100) if session.total_calls > 0 else 0
+                safe_print(f"\n🎲 {construct.upper()}: {count} calls ({percentage:.1f}%)")
+
+                # Find example calls for this construct
+                examples = [call for call in session.rng_calls if call.construct_type == construct][
+                    :3
+                ]
+                if examples:
+                    safe_print("   Examples:")
+                    for example in examples:
+                        safe_print(
+                            f"     • {example.method_name}({', '.join(map(str, example.args))}) → {example.result}"
+                        )
+                        if example.decision_impact:
+                            safe_print(f"       Impact: {example.decision_impact}")
+
+        elif args.format == "timeline":
+            # Show execution timeline
+            safe_print(f"📈 Execution Timeline: {session.session_id}")
+            safe_print(f"📁 Program: {session.input_file}")
+
+            if not session.rng_calls:
+                safe_print("🤔 No RNG calls recorded in this session")
+                return 0
 
-                    if bucket not in time_buckets:
-                        time_buckets[bucket] = {}
+            # Group calls by construct type over time
+            time_buckets = {}
+            start_time = session.rng_calls[0].timestamp
 
-                    time_buckets[bucket][construct] = time_buckets[bucket].get(construct, 0) + 1
+            for call in session.rng_calls:
+                elapsed = call.timestamp - start_time
+                bucket = int(elapsed * 10) / 10  # 0.1s buckets
+                construct = call.construct_type or "unknown"
 
-                safe_print("\n⏱️  Timeline (calls per 0.1s interval):")
-                for bucket in sorted(time_buckets.keys())[:20]:  # Show first 20 intervals
-                    calls = time_buckets[bucket]
-                    total = sum(calls.values())
-                    construct_list = ", ".join(f"{k}:{v}" for k, v in sorted(calls.items()))
-                    safe_print(f"   {bucket:4.1f}s: {total:2d} calls ({construct_list})")
+                if bucket not in time_buckets:
+                    time_buckets[bucket] = {}
 
-            # Export functionality
-            if args.export:
-                export_path = Path(args.export)
-                export_format = export_path.suffix.lower().lstrip(".")
+                time_buckets[bucket][construct] = time_buckets[bucket].get(construct, 0) + 1
 
-                if export_format == "csv":
-                    import csv
+            safe_print("\n⏱️  Timeline (calls per 0.1s interval):")
+            for bucket in sorted(time_buckets.keys())[:20]:  # Show first 20 intervals
+                calls = time_buckets[bucket]
+                total = sum(calls.values())
+                construct_list = ", ".join(f"{k}:{v}" for k, v in sorted(calls.items()))
+                safe_print(f"   {bucket:4.1f}s: {total:2d} calls ({construct_list})")
 
-                    with open(export_path, "w", newline="") as csvfile:
-                        writer = csv.writer(csvfile)
+        # Export functionality
+        if args.export:
+            export_path = Path(args.export)
+            export_format = export_path.suffix.lower().lstrip(".")
+
+            if export_format == "csv":
+                import csv
+
+                with open(export_path, "w", newline="") as csvfile:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(["sequence", "method", "args", "result", "construct", "impact"])
+                    for call in session.rng_calls:
                         writer.writerow(
-                            ["sequence", "method", "args", "result", "construct", "impact"]
+                            [
+                                call.sequence_number,
+                                call.method_name,
+                                str(call.args),
+                                call.result,
+                                call.construct_type or "",
+                                call.decision_impact or "",
+                            ]
                         )
-                        for call in session.rng_calls:
-                            writer.writerow(
-                                [
-                                    call.sequence_number,
-                                    call.method_name,
-                                    str(call.args),
-                                    call.result,
-                                    call.construct_type or "",
-                                    call.decision_impact or "",
-                                ]
-                            )
-                    safe_print(f"💾 Analysis exported to: {export_path}")
-
-                elif export_format == "json":
-                    import json
-
-                    analysis_data = {
-                        "session_metadata": {
-                            "session_id": session.session_id,
-                            "input_file": session.input_file,
-                            "duration": session.duration,
-                            "total_calls": session.total_calls,
-                        },
-                        "construct_usage": session.construct_usage,
-                        "rng_calls": [
-                            {
-                                "sequence": call.sequence_number,
-                                "method": call.method_name,
-                                "args": call.args,
-                                "result": call.result,
-                                "construct": call.construct_type,
-                                "impact": call.decision_impact,
-                                "timestamp": call.timestamp,
-                            }
-                            for call in session.rng_calls
-                        ],
-                    }
-                    with open(export_path, "w") as jsonfile:
-                        json.dump(analysis_data, jsonfile, indent=2)
-                    safe_print(f"💾 Analysis exported to: {export_path}")
-                else:
-                    safe_print(f"❌ Unsupported export format: {export_format}")
-                    safe_print("[tip] Use .csv or .json file extensions")
-                    return 1
+                safe_print(f"💾 Analysis exported to: {export_path}")
 
-            return 0
+            elif export_format == "json":
+                import json
 
-        except Exception as e:
-            safe_print(f"💥 Analysis failed: {e}")
-            safe_print("[tip] Make sure the session file is valid and not corrupted")
-            return 1
+                analysis_data = {
+                    "session_metadata": {
+                        "session_id": session.session_id,
+                        "input_file": session.input_file,
+                        "duration": session.duration,
+                        "total_calls": session.total_calls,
+                    },
+                    "construct_usage": session.construct_usage,
+                    "rng_calls": [
+                        {
+                            "sequence": call.sequence_number,
+                            "method": call.method_name,
+                            "args": call.args,
+                            "result": call.result,
+                            "construct": call.construct_type,
+                            "impact": call.decision_impact,
+                            "timestamp": call.timestamp,
+                        }
+                        for call in session.rng_calls
+                    ],
+                }
+                with open(export_path, "w") as jsonfile:
+                    json.dump(analysis_data, jsonfile, indent=2)
+                safe_print(f"💾 Analysis exported to: {export_path}")
+            else:
+                safe_print(f"❌ Unsupported export format: {export_format}")
+                safe_print("[tip] Use .csv or .json file extensions")
+                return 1
 
-    if args.command == "examples":
-        show_examples()
         return 0
 
-    if args.command == "syntax":
-        show_syntax_reference()
-        return 0
+    except Exception as e:
+        safe_print(f"💥 Analysis failed: {e}")
+        safe_print("[tip] Make sure the session file is valid and not corrupted")
+        return 1
 
-    return 1
+
+def _cmd_examples(args) -> int:
+    """Show the example programs."""
+    show_examples()
+    return 0
+
+
+def _cmd_syntax(args) -> int:
+    """Show the syntax reference."""
+    show_syntax_reference()
+    return 0
+
+
+# Subcommand name -> handler; each handler takes the parsed args and returns the exit code
+_COMMAND_HANDLERS = {
+    "transform": _cmd_transform,
+    "run": _cmd_run,
+    "interpret": _cmd_interpret,
+    "record": _cmd_record,
+    "replay": _cmd_replay,
+    "analyze": _cmd_analyze,
+    "examples": _cmd_examples,
+    "syntax": _cmd_syntax,
+}
+
+
+def main(argv=None) -> int:
+    argv = argv or sys.argv[1:]
+
+    # Fast path: `examples` and `syntax` just print, so skip argparse entirely
+    if len(argv) == 1 and argv[0] in ("examples", "syntax"):
+        return _COMMAND_HANDLERS[argv[0]](None)
+
+    args = _fast_parse(argv)
+    if args is None:
+        # Help, errors and the less common commands still go through argparse
+        args = _build_parser(_sniff_subcommand(argv)).parse_args(argv)
+
+    handler = _COMMAND_HANDLERS.get(args.command)
+    if handler is None:
+        return 1
+    return handler(args)
 
 
 if __name__ == "__main__":
@@ -7,11 +7,56 @@ from kinda.grammar.python.constructs import KindaPythonConstructs
 _SORTA_PRINT_PATTERN = re.compile(r"^\s*~sorta\s+print\s*\(")
 _ISH_VALUE_PATTERN = re.compile(r"\b(\d+(?:\.\d+)?)\s*~ish")
 _ISH_COMPARISON_PATTERN = re.compile(
-    r"([a-zA-Z_][a-zA-Z0-9_]*)\s*~ish\s+([^~]+?)(?=\s+(?:and|or)|~|\)|\]|$|#|;|:)"
+    r"(?<![a-zA-Z0-9_])([a-zA-Z_][a-zA-Z0-9_]*)\s*~ish\s+([^~]+?)(?=\s+(?:and|or)|~|\)|\]|$|#|;|:)"
 )
 _WELP_PATTERN = re.compile(r'([^~"\']*)\s*~welp\s+([^\n]+)')
 _STRING_DELIMITERS = re.compile(r'["\']{1,3}')
 
+_CONDITIONAL_KEYS = ("maybe", "sometimes", "probably", "rarely")
+_STATISTICAL_KEYS = ("assert_eventually", "assert_probability")
+
+# `~key(` openers for the constructs whose arguments are parsed by hand, compiled once up front
+_CALL_OPENERS = {
+    key: re.compile(f"^~{key}\\s*\\(") for key in _CONDITIONAL_KEYS + _STATISTICAL_KEYS
+}
+
+# Statement keywords that end the expression in front of a ~welp when scanning backwards
+_STATEMENT_KEYWORDS = frozenset({"if", "elif", "while", "for", "return", "yield", "assert", "del"})
+
+
+def _construct_gate(key: str, data: dict) -> str:
+    """Regex that must match at the start of a line for `key` to have any chance of matching."""
+    if key == "sorta_print":
+        return _SORTA_PRINT_PATTERN.pattern[1:]  # drop the ^, alternation is already anchored
+    if key in _CALL_OPENERS:
+        return _CALL_OPENERS[key].pattern[1:]
+    return data["pattern"].pattern
+
+
+# One alternation over every construct, in table order, so a line is classified in a single
+# regex call; lines that hit none of them (most plain Python) never reach the per-key loop
+_CONSTRUCT_KEYS = tuple(KindaPythonConstructs)
+_CONSTRUCT_INDEX = {key: i for i, key in enumerate(_CONSTRUCT_KEYS)}
+# (key, pattern) pairs in the same order, so dispatch doesn't re-look entries up in the table
+_CONSTRUCT_PATTERNS = tuple((key, data["pattern"]) for key, data in KindaPythonConstructs.items())
+_CONSTRUCT_GATE = re.compile(
+    "|".join(
+        f"(?P<{key}>{_construct_gate(key, data)})" for key, data in KindaPythonConstructs.items()
+    )
+)
+
+# Constructs whose gate branch is their full pattern: when one of them wins the gate, its groups
+# are the ones right after its named group, so they're sliced out instead of matching again.
+# Maps the gate's group name to the table's own key (the interned literal) and that slice.
+_GATE_GROUPS = {
+    key: (
+        key,
+        slice(_CONSTRUCT_GATE.groupindex[key], _CONSTRUCT_GATE.groupindex[key] + pattern.groups),
+    )
+    for key, pattern in _CONSTRUCT_PATTERNS
+    if key not in _CALL_OPENERS and key != "sorta_print"
+}
+
 
 def _parse_sorta_print_arguments(line: str):
     """
@@ -129,11 +174,8 @@ def _parse_conditional_arguments(line: str, construct_name: str):
     Parse conditional constructs (~maybe, ~sometimes) with balanced parentheses support.
     Maintains compatibility with existing behavior and tests.
     """
-    import re
-
     # Maintain original behavior: NO leading whitespace allowed (consistent with tests)
-    pattern = re.compile(f"^~{construct_name}\\s*\\(")
-    match = pattern.match(line)
+    match = _CALL_OPENERS[construct_name].match(line)
     if not match:
         return None
 
@@ -154,11 +196,8 @@ def _parse_statistical_arguments(line: str, construct_name: str):
     Parse statistical assertion constructs with complex parameter parsing.
     Supports named parameters like timeout=5.0, confidence=0.95, etc.
     """
-    import re
-
     # Match the construct pattern
-    pattern = re.compile(f"^~{construct_name}\\s*\\(")
-    match = pattern.match(line)
+    match = _CALL_OPENERS[construct_name].match(line)
     if not match:
         return None
 
@@ -299,25 +338,39 @@ def match_python_construct(line: str):
     """
     Enhanced Python construct matcher with robust parsing for all constructs.
     """
-    # Clean matching - no debug spam
-    for key, data in KindaPythonConstructs.items():
+    # Every construct has a `~` somewhere; a C-level scan for it lets plain Python lines skip
+    # the alternation, whose welp branch would otherwise backtrack over the whole line
+    if "~" not in line:
+        return None, None
+
+    # Leftmost-first alternation: the first gate that matches is the first key worth trying
+    gate = _CONSTRUCT_GATE.match(line)
+    if gate is None:
+        return None, None
+
+    key = gate.lastgroup
+    direct = _GATE_GROUPS.get(key)
+    if direct is not None:
+        key, group_slice = direct
+        return key, gate.groups()[group_slice]
+
+    for key, pattern in _CONSTRUCT_PATTERNS[_CONSTRUCT_INDEX[key] :]:
         if key == "sorta_print":
             # Use enhanced sorta_print parsing
             content = _parse_sorta_print_arguments(line)
             if content is not None:
                 return "sorta_print", (content,)
-        elif key in ["maybe", "sometimes", "probably", "rarely"]:
+        elif key in _CONDITIONAL_KEYS:
             # Use enhanced conditional parsing with balanced parentheses
             content = _parse_conditional_arguments(line, key)
             if content is not None:
                 return key, (content,)
-        elif key in ["assert_eventually", "assert_probability"]:
+        elif key in _STATISTICAL_KEYS:
             # Use enhanced parsing for statistical assertions with balanced parentheses
             content = _parse_statistical_arguments(line, key)
             if content is not None:
                 return key, content
         else:
-            pattern = data["pattern"]
             match = pattern.match(line)
             if match:
                 return key, match.groups()
@@ -418,6 +471,35 @@ def find_ish_constructs(line: str):
     return constructs
 
 
+class _WelpMatch:
+    """Synthetic match object for ~welp, defined once rather than per construct found."""
+
+    __slots__ = ("full_match", "primary_expr", "fallback_val", "start_pos", "end_pos")
+
+    def __init__(self, full_match, primary_expr, fallback_val, start, end):
+        self.full_match = full_match
+        self.primary_expr = primary_expr
+        self.fallback_val = fallback_val
+        self.start_pos = start
+        self.end_pos = end
+
+    def group(self, n=0):
+        if n == 0:
+            return self.full_match
+        elif n == 1:
+            return self.primary_expr
+        elif n == 2:
+            return self.fallback_val
+        else:
+            raise IndexError("No such group")
+
+    def start(self):
+        return self.start_pos
+
+    def end(self):
+        return self.end_pos
+
+
 def find_welp_constructs(line: str):
     """
     Find all ~welp constructs in a line for inline transformation.
@@ -528,16 +610,7 @@ def find_welp_constructs(line: str):
 
                     if word_end < i:
                         keyword = line[word_end:i]
-                        if keyword in [
-                            "if",
-                            "elif",
-                            "while",
-                            "for",
-                            "return",
-                            "yield",
-                            "assert",
-                            "del",
-                        ]:
+                        if keyword in _STATEMENT_KEYWORDS:
                             # Found keyword boundary - this is the start
                             actual_start = word_start
                             break
@@ -635,32 +708,8 @@ def find_welp_constructs(line: str):
             continue
 
         # Create a synthetic match object that mimics the old regex match
-        class WelpMatch:
-            def __init__(self, full_match, primary_expr, fallback_val, start, end):
-                self.full_match = full_match
-                self.primary_expr = primary_expr
-                self.fallback_val = fallback_val
-                self.start_pos = start
-                self.end_pos = end
-
-            def group(self, n=0):
-                if n == 0:
-                    return self.full_match
-                elif n == 1:
-                    return self.primary_expr
-                elif n == 2:
-                    return self.fallback_val
-                else:
-                    raise IndexError("No such group")
-
-            def start(self):
-                return self.start_pos
-
-            def end(self):
-                return self.end_pos
-
         full_match = line[expr_start:fallback_end]
-        match_obj = WelpMatch(full_match, expr_before, fallback_value, expr_start, fallback_end)
+        match_obj = _WelpMatch(full_match, expr_before, fallback_value, expr_start, fallback_end)
 
         constructs.append(("welp", match_obj, expr_start, fallback_end))
 
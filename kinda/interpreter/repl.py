@@ -4,6 +4,7 @@ import sys
 from kinda.langs.python import transformer as transformer
 from kinda.grammar.python import matchers
 from kinda.grammar.python.constructs import KindaPythonConstructs as constructs
+from kinda.grammar.python.constructs import construct_function
 from kinda.langs.python import runtime_gen
 from kinda.langs.python.transformer import transform_line
 from pathlib import Path
@@ -36,7 +37,7 @@ def run_interpreter(filepath, lang="python"):
     # === Prepare runtime ===
     runtime_path = Path("kinda/langs/python/runtime")
     runtime_gen.generate_runtime(runtime_path)
-    helper_imports = runtime_gen.generate_runtime_helpers(
+    runtime_gen.generate_runtime_helpers(
         transformer.used_helpers,
         runtime_path,
         constructs,
@@ -48,7 +49,11 @@ def run_interpreter(filepath, lang="python"):
     if not hasattr(fuzzy, "env"):
         fuzzy.env = {}
 
-    exec(helper_imports, {}, fuzzy.env)
+    # The loaded runtime already holds the real helpers; only fill in any it's missing
+    for key in sorted(transformer.used_helpers):
+        if key in constructs:
+            func = construct_function(key)
+            fuzzy.env.setdefault(func.__name__, func)
 
     try:
         exec(code, fuzzy.env, fuzzy.env)
@@ -14,6 +14,9 @@ from kinda.grammar.c.constructs_c import KindaCConstructs
 
 used_helpers: Set[str] = set()
 
+# Lines starting with one of these open a conditional block
+_CONDITIONAL_PREFIXES = ("sometimes", "maybe")
+
 
 def _process_conditional_block(
     lines: List[str], start_index: int, output_lines: List[str], indent: str
@@ -43,7 +46,7 @@ def _process_conditional_block(
             continue
 
         # Handle nested conditional constructs
-        if stripped.startswith("sometimes") or stripped.startswith("maybe"):
+        if stripped.startswith(_CONDITIONAL_PREFIXES):
             transformed_nested = transform_line(line)
             output_lines.extend([indent + l for l in transformed_nested])
             i += 1
@@ -168,7 +171,7 @@ def transform_file(path: Path, target_language="c") -> str:
         line = lines[i]
         stripped = line.strip()
 
-        if stripped.startswith("sometimes") or stripped.startswith("maybe"):
+        if stripped.startswith(_CONDITIONAL_PREFIXES):
             output_lines.extend(transform_line(line))
             i += 1
             # Process block with proper nesting support
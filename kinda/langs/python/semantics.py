@@ -1,13 +1,24 @@
 # kinda/core/semantics.py
 
+from functools import lru_cache
+
 from kinda.personality import chaos_random, chaos_choice
 
 env = {}
 
+# Bound on first use: the interpreter imports this module, so it can't be imported at the top
+_process_line = None
+
+
+@lru_cache(maxsize=1024)
+def _compile_expr(expr):
+    """Compile an expression once; loops and blocks evaluate the same strings over and over"""
+    return compile(expr, "<kinda>", "eval")
+
 
 def evaluate(expr):
     try:
-        return eval(expr, {}, env)
+        return eval(_compile_expr(expr), {}, env)
     except:
         return None
 
@@ -26,18 +37,25 @@ def kinda_assign(var, expr):
 def sorta_print(expr):
     if chaos_random() < 0.8:
         try:
-            print(f"[print] {eval(expr, {}, env)}")
+            print(f"[print] {eval(_compile_expr(expr), {}, env)}")
         except:
             print(f"[print] Failed to evaluate: {expr}")
 
 
+def _load_process_line():
+    global _process_line
+    if _process_line is None:
+        from kinda.interpreter.__main__ import process_line as _process_line
+    return _process_line
+
+
 def run_sometimes_block(condition, block_lines):
     if chaos_random() < 0.7:
         if evaluate(condition):
-            for line in block_lines:
-                from kinda.interpreter.__main__ import process_line
-
-                process_line(line.strip())
+            if block_lines:
+                process_line = _load_process_line()
+                for line in block_lines:
+                    process_line(line.strip())
         else:
             print("[sometimes] condition false")
     else:
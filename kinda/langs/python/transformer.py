@@ -1,8 +1,11 @@
+import os
 import re
+from functools import lru_cache
+from io import StringIO
+from itertools import repeat
 from pathlib import Path
-from typing import List
-from kinda.langs.python.runtime_gen import generate_runtime_helpers, generate_runtime
-from kinda.grammar.python.constructs import KindaPythonConstructs
+from typing import Dict, FrozenSet, List, Set, Tuple, Union
+from kinda.langs.python.runtime_gen import generate_runtime
 from kinda.grammar.python.matchers import (
     match_python_construct,
     find_ish_constructs,
@@ -12,9 +15,45 @@ from kinda.cli import safe_read_file
 
 used_helpers = set()
 
+# fuzzy.py files transform() has written during this process, mapped to their (mtime, size)
+_generated_runtimes = {}
+
+# transform() only starts a process pool once a directory has this many .knda files per worker
+_PARALLEL_MIN_FILES = 8
+
+# Lines starting with one of these open a conditional block
+_CONDITIONAL_PREFIXES = ("~sometimes", "~maybe", "~probably", "~rarely")
+
+# Statements that put a `x ~ish y` on the line into a comparison context
+_CONDITIONAL_KEYWORDS = frozenset({"if", "elif", "while", "assert", "return"})
+
+# What follows the variable name in a `x ~ish y` assignment
+_ISH_ASSIGN_TAIL = re.compile(r"\s*~ish\s+")
+
+# variable~drift followed by ~ish (special case), and variable~drift on its own
+_DRIFT_ISH_PATTERN = re.compile(r"\b([a-zA-Z_][a-zA-Z0-9_]*)\s*~\s*drift\s+~\s*ish\s+([^~#;]+)")
+_DRIFT_PATTERN = re.compile(r"\b([a-zA-Z_][a-zA-Z0-9_]*)\s*~\s*drift\b")
+
+
+def _split_indent(line: str) -> Tuple[int, str]:
+    """Return a line's indentation width and its stripped text from a single lstrip."""
+    content = line.lstrip()
+    return len(line) - len(content), content.rstrip()
+
+
+def _write_lines(out: StringIO, lines: List[str], indent: str = "") -> None:
+    """Write transformed lines to `out`, each prefixed with `indent` and ended by a newline."""
+    # Writing the pieces separately is cheaper than building `indent + line + "\n"` for each
+    # line only to copy it into the buffer again
+    write = out.write
+    for line in lines:
+        write(indent)
+        write(line)
+        write("\n")
+
 
 def _process_conditional_block(
-    lines: List[str], start_index: int, output_lines: List[str], indent: str, file_path: str = None
+    lines: List[str], start_index: int, out: StringIO, indent: str, file_path: str = None
 ) -> int:
     """
     Process a conditional block (~sometimes, ~maybe, or ~probably) with proper nesting support.
@@ -36,9 +75,7 @@ def _process_conditional_block(
                 # Check for else block syntax: } {
                 if i < len(lines) and lines[i].strip() == "{":
                     # Found else block - add Python else syntax
-                    output_lines.append(
-                        indent[:-4] + "else:"
-                    )  # Remove one level of indent for else
+                    out.write(indent[:-4] + "else:\n")  # Remove one level of indent for else
                     i += 1  # Skip the opening brace of else block
                     # Continue processing the else block content
                     brace_count = 1  # Reset for else block processing
@@ -51,7 +88,7 @@ def _process_conditional_block(
             brace_count -= 1
             if brace_count == 0:
                 # Add Python else syntax
-                output_lines.append(indent[:-4] + "else:")  # Remove one level of indent for else
+                out.write(indent[:-4] + "else:\n")  # Remove one level of indent for else
                 i += 1  # Move to next line
                 # Continue processing the else block content
                 brace_count = 1  # Reset for else block processing
@@ -59,18 +96,15 @@ def _process_conditional_block(
 
         # Empty lines or comments - pass through with indentation
         if not stripped or stripped.startswith("#"):
-            output_lines.append(indent + line)
+            out.write(indent)
+            out.write(line)
+            out.write("\n")
             i += 1
             continue
 
         try:
             # Handle nested conditional constructs
-            if (
-                stripped.startswith("~sometimes")
-                or stripped.startswith("~maybe")
-                or stripped.startswith("~probably")
-                or stripped.startswith("~rarely")
-            ):
+            if stripped.startswith(_CONDITIONAL_PREFIXES):
                 if not _validate_conditional_syntax(stripped, line_number, file_path):
                     i += 1
                     continue
@@ -78,11 +112,10 @@ def _process_conditional_block(
                 # Note: Don't increment brace_count for nested constructs
                 # The recursive call will handle the nested block's braces
 
-                transformed_nested = transform_line(line)
-                output_lines.extend([indent + l for l in transformed_nested])
+                _write_lines(out, transform_line(line), indent)
                 i += 1
                 # Recursively process nested block with increased indentation
-                i = _process_conditional_block(lines, i, output_lines, indent + "    ", file_path)
+                i = _process_conditional_block(lines, i, out, indent + "    ", file_path)
             else:
                 # Track opening braces in other constructs (shouldn't happen in kinda but just in case)
                 if stripped.endswith("{"):
@@ -92,7 +125,7 @@ def _process_conditional_block(
                 transformed_block = transform_line(line)
                 if not transformed_block:
                     _warn_about_line(stripped, line_number, file_path)
-                output_lines.extend([indent + l for l in transformed_block])
+                _write_lines(out, transformed_block, indent)
                 i += 1
         except Exception as e:
             raise KindaParseError(
@@ -113,7 +146,7 @@ def _process_conditional_block(
 def _process_python_indented_block(
     lines: List[str],
     start_index: int,
-    output_lines: List[str],
+    out: StringIO,
     conditional_line: str,
     file_path: str = None,
 ) -> int:
@@ -122,22 +155,20 @@ def _process_python_indented_block(
     Returns the index after processing the block.
     """
     i = start_index
-    base_indent = len(conditional_line) - len(conditional_line.lstrip())
+    base_indent = _split_indent(conditional_line)[0]
 
     while i < len(lines):
         line = lines[i]
-        stripped = line.strip()
+        line_indent, stripped = _split_indent(line)
         line_number = i + 1
 
         # Empty lines - pass through
         if not stripped:
-            output_lines.append(line)
+            out.write(line)
+            out.write("\n")
             i += 1
             continue
 
-        # Calculate indentation level
-        line_indent = len(line) - len(line.lstrip())
-
         # If line is not indented more than the conditional, we've reached the end of the block
         if line_indent <= base_indent and stripped:
             break
@@ -147,7 +178,7 @@ def _process_python_indented_block(
             transformed = transform_line(line)
             if not transformed:
                 _warn_about_line(stripped, line_number, file_path)
-            output_lines.extend(transformed)
+            _write_lines(out, transformed)
             i += 1
         except Exception as e:
             raise KindaParseError(
@@ -157,15 +188,41 @@ def _process_python_indented_block(
     return i
 
 
+def _is_conditional_ish_context(stripped_line: str) -> bool:
+    """Check whether a line uses ~ish as a comparison rather than an assignment."""
+    # Plain `in` checks are C-level substring scans that stop at the first hit; building a
+    # str.translate copy to spot operators by length difference measured ~20x slower on
+    # typical lines, so each marker keeps its own membership test
+    return (
+        stripped_line.partition(" ")[0] in _CONDITIONAL_KEYWORDS
+        or " if " in stripped_line
+        or " and " in stripped_line
+        or " or " in stripped_line
+        # Check if ~ish is inside parentheses, brackets, or after assignment
+        or ("=" in stripped_line and stripped_line.find("=") < stripped_line.find("~ish"))
+        or "(" in stripped_line.split("~ish")[0]  # Function call context
+        or "[" in stripped_line  # List/dict context
+        or "{" in stripped_line  # Dict context
+    )
+
+
 def _transform_ish_constructs(line: str) -> str:
     """Transform inline ~ish constructs in a line."""
     ish_constructs = find_ish_constructs(line)
     if not ish_constructs:
         return line
 
-    # Transform from right to left to preserve positions
-    transformed_line = line
-    for construct_type, match, start_pos, end_pos in reversed(ish_constructs):
+    # The assignment/comparison context only depends on the line, so work it out once
+    stripped_line = None
+    is_in_conditional = False
+
+    # Build the result left to right from the untouched gaps and the replacements, so each
+    # character is copied once instead of re-slicing the whole line for every construct
+    parts = []
+    last_end = 0
+    for construct_type, match, start_pos, end_pos in ish_constructs:
+        if start_pos < last_end:
+            continue  # Overlaps a construct that has already been replaced
         if construct_type == "ish_value":
             used_helpers.add("ish_value")
             value = match.group(1)
@@ -175,30 +232,16 @@ def _transform_ish_constructs(line: str) -> str:
             right_val = match.group(2).strip()
 
             # CRITICAL FIX: Detect assignment vs comparison context
-            stripped_line = line.strip()
-
-            # Check if this is in a conditional/comparison context first
-            is_in_conditional = (
-                stripped_line.startswith("if ")
-                or stripped_line.startswith("elif ")
-                or stripped_line.startswith("while ")
-                or stripped_line.startswith("assert ")
-                or " if " in stripped_line
-                or " and " in stripped_line
-                or " or " in stripped_line
-                or stripped_line.startswith("return ")
-                # Check if ~ish is inside parentheses, brackets, or after assignment
-                or ("=" in stripped_line and stripped_line.find("=") < stripped_line.find("~ish"))
-                or "(" in stripped_line.split("~ish")[0]  # Function call context
-                or "[" in stripped_line  # List/dict context
-                or "{" in stripped_line  # Dict context
-            )
+            if stripped_line is None:
+                stripped_line = line.strip()
+                is_in_conditional = _is_conditional_ish_context(stripped_line)
 
             # Check if this is a standalone variable assignment
             # Pattern: line starts with variable_name ~ish (possibly with whitespace)
             is_variable_assignment = (
-                re.match(rf"^\s*{re.escape(left_val)}\s*~ish\s+", stripped_line)
-                and not is_in_conditional
+                not is_in_conditional
+                and stripped_line.startswith(left_val)
+                and _ISH_ASSIGN_TAIL.match(stripped_line, len(left_val))
             )
 
             if is_variable_assignment:
@@ -219,41 +262,41 @@ def _transform_ish_constructs(line: str) -> str:
         else:
             continue  # Skip unknown constructs
 
-        # Replace the matched text
-        transformed_line = transformed_line[:start_pos] + replacement + transformed_line[end_pos:]
+        parts.append(line[last_end:start_pos])
+        parts.append(replacement)
+        last_end = end_pos
 
-    return transformed_line
+    if not parts:
+        return line
+    parts.append(line[last_end:])
+    return "".join(parts)
 
 
-def _transform_drift_constructs(line: str) -> str:
-    """Transform inline ~drift constructs in a line."""
-    import re
+def _replace_drift_ish(match) -> str:
+    var_name = match.group(1)
+    comparison_val = match.group(2).strip()
+    used_helpers.add("drift_access")
+    used_helpers.add("ish_comparison")
+    return f"ish_comparison(drift_access('{var_name}', {var_name}), {comparison_val})"
 
-    # Pattern to match variable~drift followed by ~ish (special case)
-    drift_ish_pattern = re.compile(r"\b([a-zA-Z_][a-zA-Z0-9_]*)\s*~\s*drift\s+~\s*ish\s+([^~#;]+)")
 
-    # Pattern to match variable~drift (general case)
-    drift_pattern = re.compile(r"\b([a-zA-Z_][a-zA-Z0-9_]*)\s*~\s*drift\b")
+def _replace_drift(match) -> str:
+    var_name = match.group(1)
+    used_helpers.add("drift_access")
+    return f"drift_access('{var_name}', {var_name})"
 
-    # First handle the special case of drift + ish
-    def replace_drift_ish(match):
-        var_name = match.group(1)
-        comparison_val = match.group(2).strip()
-        used_helpers.add("drift_access")
-        used_helpers.add("ish_comparison")
-        return f"ish_comparison(drift_access('{var_name}', {var_name}), {comparison_val})"
 
-    # Apply drift+ish pattern first
-    transformed_line = drift_ish_pattern.sub(replace_drift_ish, line)
+def _transform_drift_constructs(line: str) -> str:
+    """Transform inline ~drift constructs in a line."""
+    # Both patterns need the word; most lines with a tilde are some other construct
+    if "drift" not in line:
+        return line
+
+    # First handle the special case of drift + ish
+    transformed_line = _DRIFT_ISH_PATTERN.sub(_replace_drift_ish, line)
 
     # Then apply general drift pattern to remaining cases
-    def replace_drift(match):
-        var_name = match.group(1)
-        used_helpers.add("drift_access")
-        return f"drift_access('{var_name}', {var_name})"
-
-    transformed_line = drift_pattern.sub(replace_drift, transformed_line)
-    return transformed_line
+    return _DRIFT_PATTERN.sub(_replace_drift, transformed_line)
 
 
 def _transform_welp_constructs(line: str) -> str:
@@ -262,24 +305,150 @@ def _transform_welp_constructs(line: str) -> str:
     if not welp_constructs:
         return line
 
-    # Transform from right to left to preserve positions
-    transformed_line = line
-    for construct_type, match, start_pos, end_pos in reversed(welp_constructs):
-        if construct_type == "welp":
-            used_helpers.add("welp_fallback")
-            primary_expr = match.group(1).strip()
-            fallback_value = match.group(2).strip()
-            replacement = f"welp_fallback(lambda: {primary_expr}, {fallback_value})"
-
-            # Replace the matched text
-            transformed_line = (
-                transformed_line[:start_pos] + replacement + transformed_line[end_pos:]
-            )
+    # A chain like `a ~welp b ~welp c`, or `f(a ~welp b) ~welp c`, yields a later construct
+    # whose primary contains the earlier ones; keep the outer one and nest its primary below
+    chosen = []
+    for construct_type, match, start_pos, end_pos in welp_constructs:
+        if construct_type != "welp":
+            continue
+        while chosen and start_pos <= chosen[-1][1]:
+            chosen.pop()
+        if not chosen or start_pos >= chosen[-1][2]:
+            chosen.append((match, start_pos, end_pos))
+
+    # Same left-to-right build as _transform_ish_constructs
+    parts = []
+    last_end = 0
+    for match, start_pos, end_pos in chosen:
+        used_helpers.add("welp_fallback")
+        primary_expr = match.group(1).strip()
+        if "~welp" in primary_expr:
+            primary_expr = _transform_welp_constructs(primary_expr)
+        fallback_value = match.group(2).strip()
+        parts.append(line[last_end:start_pos])
+        parts.append(f"welp_fallback(lambda: {primary_expr}, {fallback_value})")
+        last_end = end_pos
+
+    if not parts:
+        return line
+    parts.append(line[last_end:])
+    return "".join(parts)
+
+
+def _handle_assign_call(key, groups):
+    """`~kinda int x = 5` style declarations: `x = kinda_int(5)`"""
+    var, val = groups
+    return key, f"{var} = {key}({val})"
+
+
+def _handle_named_assign_call(helper):
+    """Helpers that also get the variable's name: `x = fuzzy_assign('x', 5)`"""
+
+    def handle(key, groups):
+        var, val = groups
+        return helper, f"{var} = {helper}('{var}', {val})"
+
+    return handle
+
+
+def _handle_drift_access(key, groups):
+    var = groups[0]
+    return "drift_access", f"drift_access('{var}')"
+
+
+def _handle_kinda_binary(key, groups):
+    if len(groups) == 2 and groups[1]:  # Custom probabilities provided
+        var, probs = groups
+        return "kinda_binary", f"{var} = kinda_binary({probs})"
+    # Default probabilities
+    var = groups[0]
+    return "kinda_binary", f"{var} = kinda_binary()"
+
+
+def _handle_sorta_print(key, groups):
+    (expr,) = groups
+    return "sorta_print", f"sorta_print({expr})"
+
+
+def _handle_conditional(key, groups):
+    """~sometimes, ~maybe, ~probably and ~rarely all become `if <key>(<cond>):`"""
+    cond = groups[0].strip() if groups and groups[0] else ""
+    return key, f"if {key}({cond}):" if cond else f"if {key}():"
+
+
+def _handle_assert_eventually(key, groups):
+    condition, timeout, confidence = groups
+
+    # Build function call with optional parameters
+    args = [condition] if condition else ["True"]
+    if timeout is not None:
+        args.append(f"timeout={timeout}")
+    if confidence is not None:
+        args.append(f"confidence={confidence}")
+
+    return "assert_eventually", f"assert_eventually({', '.join(args)})"
+
+
+def _handle_assert_probability(key, groups):
+    event, expected_prob, tolerance, samples = groups
+
+    # Build function call with optional parameters
+    args = [event] if event else ["True"]
+    if expected_prob is not None:
+        args.append(f"expected_prob={expected_prob}")
+    if tolerance is not None:
+        args.append(f"tolerance={tolerance}")
+    if samples is not None:
+        args.append(f"samples={samples}")
 
-    return transformed_line
+    return "assert_probability", f"assert_probability({', '.join(args)})"
+
+
+# Construct key -> handler(key, groups) returning (runtime helper used, transformed code).
+# Keys without a handler (e.g. ish_value, which is rewritten inline) fall back to the line as-is.
+_CONSTRUCT_HANDLERS = {
+    "kinda_int": _handle_assign_call,
+    "kinda_bool": _handle_assign_call,
+    "kinda_float": _handle_assign_call,
+    "time_drift_float": _handle_named_assign_call("time_drift_float"),
+    "time_drift_int": _handle_named_assign_call("time_drift_int"),
+    "drift_access": _handle_drift_access,
+    "kinda_binary": _handle_kinda_binary,
+    "sorta_print": _handle_sorta_print,
+    "sometimes": _handle_conditional,
+    "maybe": _handle_conditional,
+    "probably": _handle_conditional,
+    "rarely": _handle_conditional,
+    "fuzzy_reassign": _handle_named_assign_call("fuzzy_assign"),
+    "assert_eventually": _handle_assert_eventually,
+    "assert_probability": _handle_assert_probability,
+}
 
 
 def transform_line(line: str) -> List[str]:
+    lines, helpers = _transform_line_cached(line)
+    used_helpers.update(helpers)
+    return list(lines)
+
+
+@lru_cache(maxsize=4096)
+def _transform_line_cached(line: str) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+    """
+    Transform a line once and remember both its output and the helpers it needed, so a repeated
+    line (common across the files of one build) still records its helpers on a cache hit.
+    """
+    global used_helpers
+    # The construct passes add to the module-level set, so give them a fresh one for this line
+    outer_helpers = used_helpers
+    used_helpers = set()
+    try:
+        lines = _transform_line(line)
+        return tuple(lines), frozenset(used_helpers)
+    finally:
+        used_helpers = outer_helpers
+
+
+def _transform_line(line: str) -> List[str]:
     original_line = line
     stripped = line.strip()
 
@@ -288,6 +457,9 @@ def transform_line(line: str) -> List[str]:
         return [""]
     if stripped.startswith("#"):
         return [original_line]
+    # Every construct, inline or not, contains a tilde; plain Python lines skip all the passes
+    if "~" not in stripped:
+        return [original_line]
 
     # Check for inline constructs in a single pass for efficiency
     # First check for inline ~drift constructs (must be before ~ish due to ~drift ~ish pattern)
@@ -302,113 +474,21 @@ def transform_line(line: str) -> List[str]:
     # Then check for main kinda constructs on the (potentially transformed) line
     stripped_for_matching = welp_transformed_line.strip()
     key, groups = match_python_construct(stripped_for_matching)
-    if not key:
+    # ~welp is rewritten by the inline pass above, so a "welp" match here is a ~welp that pass
+    # deliberately left alone (e.g. inside a string) and there's no main construct to emit
+    if not key or key == "welp":
         # If no main construct found but transforms were applied, return the transformed line
         if welp_transformed_line != line:
             return [welp_transformed_line]
         else:
             return [original_line]
 
-    if key == "kinda_int":
-        var, val = groups
-        used_helpers.add("kinda_int")
-        transformed_code = f"{var} = kinda_int({val})"
-
-    elif key == "kinda_bool":
-        var, val = groups
-        used_helpers.add("kinda_bool")
-        transformed_code = f"{var} = kinda_bool({val})"
-
-    elif key == "kinda_float":
-        var, val = groups
-        used_helpers.add("kinda_float")
-        transformed_code = f"{var} = kinda_float({val})"
-
-    elif key == "time_drift_float":
-        var, val = groups
-        used_helpers.add("time_drift_float")
-        transformed_code = f"{var} = time_drift_float('{var}', {val})"
-
-    elif key == "time_drift_int":
-        var, val = groups
-        used_helpers.add("time_drift_int")
-        transformed_code = f"{var} = time_drift_int('{var}', {val})"
-
-    elif key == "drift_access":
-        var = groups[0]
-        used_helpers.add("drift_access")
-        transformed_code = f"drift_access('{var}')"
-
-    elif key == "kinda_binary":
-        if len(groups) == 2 and groups[1]:  # Custom probabilities provided
-            var, probs = groups
-            used_helpers.add("kinda_binary")
-            transformed_code = f"{var} = kinda_binary({probs})"
-        else:  # Default probabilities
-            var = groups[0]
-            used_helpers.add("kinda_binary")
-            transformed_code = f"{var} = kinda_binary()"
-
-    elif key == "sorta_print":
-        (expr,) = groups
-        used_helpers.add("sorta_print")
-        transformed_code = f"sorta_print({expr})"
-
-    elif key == "sometimes":
-        used_helpers.add("sometimes")
-        cond = groups[0].strip() if groups and groups[0] else ""
-        transformed_code = f"if sometimes({cond}):" if cond else "if sometimes():"
-
-    elif key == "maybe":
-        used_helpers.add("maybe")
-        cond = groups[0].strip() if groups and groups[0] else ""
-        transformed_code = f"if maybe({cond}):" if cond else "if maybe():"
-
-    elif key == "probably":
-        used_helpers.add("probably")
-        cond = groups[0].strip() if groups and groups[0] else ""
-        transformed_code = f"if probably({cond}):" if cond else "if probably():"
-
-    elif key == "rarely":
-        used_helpers.add("rarely")
-        cond = groups[0].strip() if groups and groups[0] else ""
-        transformed_code = f"if rarely({cond}):" if cond else "if rarely():"
-
-    elif key == "fuzzy_reassign":
-        var, val = groups
-        used_helpers.add("fuzzy_assign")
-        transformed_code = f"{var} = fuzzy_assign('{var}', {val})"
-
-    elif key == "assert_eventually":
-        used_helpers.add("assert_eventually")
-        condition, timeout, confidence = groups
-
-        # Build function call with optional parameters
-        args = [condition] if condition else ["True"]
-        if timeout is not None:
-            args.append(f"timeout={timeout}")
-        if confidence is not None:
-            args.append(f"confidence={confidence}")
-
-        transformed_code = f"assert_eventually({', '.join(args)})"
-
-    elif key == "assert_probability":
-        used_helpers.add("assert_probability")
-        event, expected_prob, tolerance, samples = groups
-
-        # Build function call with optional parameters
-        args = [event] if event else ["True"]
-        if expected_prob is not None:
-            args.append(f"expected_prob={expected_prob}")
-        if tolerance is not None:
-            args.append(f"tolerance={tolerance}")
-        if samples is not None:
-            args.append(f"samples={samples}")
-
-        transformed_code = f"assert_probability({', '.join(args)})"
-
-    else:
+    handler = _CONSTRUCT_HANDLERS.get(key)
+    if handler is None:
         transformed_code = stripped  # fallback
+    else:
+        helper, transformed_code = handler(key, groups)
+        used_helpers.add(helper)
 
     # Debug removed for clean UX
 
@@ -425,6 +505,10 @@ class KindaParseError(Exception):
         self.file_path = file_path
         super().__init__(self._format_message())
 
+    def __reduce__(self):
+        # Rebuild from the original fields so errors survive the trip back from worker processes
+        return type(self), (self.message, self.line_number, self.line_content, self.file_path)
+
     def _format_message(self):
         location = f"line {self.line_number}"
         if self.file_path:
@@ -443,13 +527,39 @@ def transform_file(path: Path, target_language="python") -> str:
     try:
         # Use safe encoding-aware file reading for Windows compatibility
         content = safe_read_file(path)
-        lines = content.splitlines()
     except UnicodeDecodeError as e:
         raise KindaParseError(f"File encoding issue - try saving as UTF-8: {e}", 0, "", str(path))
     except OSError as e:
         raise KindaParseError(f"Cannot read file: {e}", 0, "", str(path))
 
-    output_lines = []
+    return transform_source(content, str(path), target_language)
+
+
+def transform_source(text: str, filename: str = "<string>", target_language="python") -> str:
+    """Transform .knda source text; filename is only used in error reports"""
+    global used_helpers
+    # Collect this file's helpers on their own so its header imports only what it uses; they're
+    # still merged into the module-level set, which the REPL and runtime generation read
+    outer_helpers = used_helpers
+    used_helpers = set()
+    try:
+        body = _transform_source_body(text, filename)
+        return _runtime_header(used_helpers, target_language) + body
+    finally:
+        outer_helpers |= used_helpers
+        used_helpers = outer_helpers
+
+
+def _transform_source_body(text: str, filename: str) -> str:
+    lines = text.splitlines()
+
+    # Every construct contains a tilde; without one the per-line pass would only blank out
+    # whitespace-only lines, so a plain Python file skips it
+    if "~" not in text:
+        return "\n".join(line if line.strip() else "" for line in lines)
+
+    # Emitted lines go straight into one buffer, each followed by a newline
+    out = StringIO()
     i = 0
 
     while i < len(lines):
@@ -458,124 +568,206 @@ def transform_file(path: Path, target_language="python") -> str:
         line_number = i + 1  # 1-based line numbers
 
         try:
-            if (
-                stripped.startswith("~sometimes")
-                or stripped.startswith("~maybe")
-                or stripped.startswith("~probably")
-                or stripped.startswith("~rarely")
-            ):
+            if stripped.startswith(_CONDITIONAL_PREFIXES):
                 # Validate conditional syntax
-                if not _validate_conditional_syntax(stripped, line_number, str(path)):
+                if not _validate_conditional_syntax(stripped, line_number, filename):
                     i += 1
                     continue
 
-                output_lines.extend(transform_line(line))
+                _write_lines(out, transform_line(line))
                 i += 1
 
                 # Only process as block if there's an opening brace
                 if stripped.endswith("{"):
                     # Process block with proper nesting support and error handling
-                    i = _process_conditional_block(lines, i, output_lines, "    ", str(path))
+                    i = _process_conditional_block(lines, i, out, "    ", filename)
                 else:
                     # Python-style indented block - process indented lines
-                    i = _process_python_indented_block(lines, i, output_lines, line, str(path))
+                    i = _process_python_indented_block(lines, i, out, line, filename)
             else:
                 transformed = transform_line(line)
                 if not transformed:  # Empty result might indicate parse failure
-                    _warn_about_line(stripped, line_number, str(path))
-                output_lines.extend(transformed)
+                    _warn_about_line(stripped, line_number, filename)
+                _write_lines(out, transformed)
                 i += 1
 
         except Exception as e:
-            raise KindaParseError(f"Transform failed: {str(e)}", line_number, line, str(path))
+            raise KindaParseError(f"Transform failed: {str(e)}", line_number, line, filename)
 
-    header = ""
-    if used_helpers:
-        helpers = ", ".join(sorted(used_helpers))
-        header = f"from kinda.langs.{target_language}.runtime.fuzzy import {helpers}\n\n"
+    # Drop the newline after the last line so the output matches a "\n".join of the lines
+    if out.tell():
+        out.truncate(out.tell() - 1)
+    return out.getvalue()
 
-    return header + "\n".join(output_lines)
+
+def _runtime_header(helpers: Set[str], target_language: str) -> str:
+    """Import line for the given runtime helpers, or nothing if there are none"""
+    if not helpers:
+        return ""
+    helpers = ", ".join(sorted(helpers))
+    return f"from kinda.langs.{target_language}.runtime.fuzzy import {helpers}\n\n"
 
 
 def _validate_conditional_syntax(line: str, line_number: int, file_path: str) -> bool:
     """Validate ~sometimes, ~maybe, ~probably, and ~rarely syntax with helpful error messages"""
-    if line.startswith("~sometimes"):
-        if "(" not in line:
-            raise KindaParseError(
-                "~sometimes needs parentheses. Try: ~sometimes() or ~sometimes(condition)",
-                line_number,
-                line,
-                file_path,
-            )
-    elif line.startswith("~maybe"):
-        if "(" not in line:
-            raise KindaParseError(
-                "~maybe needs parentheses. Try: ~maybe() or ~maybe(condition)",
-                line_number,
-                line,
-                file_path,
-            )
-    elif line.startswith("~probably"):
-        if "(" not in line:
-            raise KindaParseError(
-                "~probably needs parentheses. Try: ~probably() or ~probably(condition)",
-                line_number,
-                line,
-                file_path,
-            )
-    elif line.startswith("~rarely"):
-        if "(" not in line:
-            raise KindaParseError(
-                "~rarely needs parentheses. Try: ~rarely() or ~rarely(condition)",
-                line_number,
-                line,
-                file_path,
-            )
+    if line.startswith(_CONDITIONAL_PREFIXES) and "(" not in line:
+        construct = next(prefix for prefix in _CONDITIONAL_PREFIXES if line.startswith(prefix))
+        raise KindaParseError(
+            f"{construct} needs parentheses. Try: {construct}() or {construct}(condition)",
+            line_number,
+            line,
+            file_path,
+        )
     return True
 
 
 def _warn_about_line(line: str, line_number: int, file_path: str):
     """Warn about potentially problematic lines"""
-    if line and not line.startswith("#"):
-        # Check for common mistakes
-        if "kinda" in line.lower() and not line.startswith("~"):
-            print(
-                f"⚠️  Line {line_number}: Did you mean to start with ~ ? (kinda constructs need ~)"
-            )
-        elif line.startswith("sorta") and not line.startswith("~"):
-            print(f"⚠️  Line {line_number}: Did you mean ~sorta print(...) ?")
-        elif "sometimes" in line and not line.startswith("~"):
-            print(f"⚠️  Line {line_number}: Did you mean ~sometimes (...) {{ ?")
-        elif "maybe" in line and not line.startswith("~"):
-            print(f"⚠️  Line {line_number}: Did you mean ~maybe (...) {{ ?")
+    # Lines already starting with ~ (or comments) aren't a forgotten tilde
+    if not line or line.startswith(("#", "~")):
+        return
+
+    # Check for common mistakes
+    if "kinda" in line.lower():
+        print(f"⚠️  Line {line_number}: Did you mean to start with ~ ? (kinda constructs need ~)")
+    elif line.startswith("sorta"):
+        print(f"⚠️  Line {line_number}: Did you mean ~sorta print(...) ?")
+    elif "sometimes" in line:
+        print(f"⚠️  Line {line_number}: Did you mean ~sometimes (...) {{ ?")
+    elif "maybe" in line:
+        print(f"⚠️  Line {line_number}: Did you mean ~maybe (...) {{ ?")
+
+
+def _transform_dir_entry(file: Path, input_path: Path, out_dir: Path) -> Path:
+    """Transform one file found under `input_path`, mirroring its location under `out_dir`."""
+    try:
+        output_code = transform_file(file)
+        relative_path = file.relative_to(input_path)
+
+        if file.name.endswith(".py.knda"):
+            new_name = file.name.replace(".py.knda", ".py")
+        else:
+            new_name = file.stem + ".py"
+
+        output_file_path = out_dir / relative_path.with_name(new_name)
+        output_file_path.parent.mkdir(parents=True, exist_ok=True)
+        output_file_path.write_text(output_code, encoding="utf-8")
+        return output_file_path
+    except KindaParseError:
+        # Re-raise parse errors to be handled by CLI
+        raise
+    except Exception as e:
+        raise KindaParseError(f"Failed to process file: {str(e)}", 0, "", str(file))
+
+
+def _transform_dir_entry_in_worker(file: Path, input_path: Path, out_dir: Path):
+    """
+    Process-pool version of _transform_dir_entry.
+    Returns the output path and the helpers the file used, for the parent to merge.
+    """
+    # A worker handles many files, so start each one from a clean slate and hand back
+    # only that file's helpers
+    used_helpers.clear()
+    output_file_path = _transform_dir_entry(file, input_path, out_dir)
+    return output_file_path, frozenset(used_helpers)
+
+
+def _transform_file_in_worker(path: Path):
+    """Process-pool version of transform_file, returning the code and the helpers it used."""
+    used_helpers.clear()
+    code = transform_file(path)
+    return code, frozenset(used_helpers)
+
+
+def _worker_count(file_count: int) -> int:
+    """Worker processes worth starting for `file_count` files; 1 or less means stay in-process."""
+    return min(os.cpu_count() or 1, file_count // _PARALLEL_MIN_FILES)
+
+
+def _chunksize(file_count: int, workers: int) -> int:
+    """Files handed to a worker at a time: about four batches each, to even out the load."""
+    return max(1, file_count // (workers * 4))
+
+
+def transform_files(paths: List[Union[str, Path]]) -> Dict[Path, str]:
+    """
+    Transform several .knda files to Python source without writing anything.
+    Enough files are spread over a process pool, the same way transform() handles a directory.
+    """
+    paths = [Path(path) for path in paths]
+    workers = _worker_count(len(paths))
+    if workers <= 1:
+        return {path: transform_file(path) for path in paths}
+
+    from concurrent.futures import ProcessPoolExecutor
 
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        outputs = executor.map(
+            _transform_file_in_worker, paths, chunksize=_chunksize(len(paths), workers)
+        )
+        for path, (code, helpers) in zip(paths, outputs):
+            used_helpers.update(helpers)
+            results[path] = code
+    return results
 
-def transform(input_path: Path, out_dir: Path) -> List[Path]:
+
+def _ensure_runtime(runtime_path: Path) -> None:
+    """
+    Write the fuzzy runtime into `runtime_path` unless this process already has.
+    generate_runtime always emits every construct, so the file only depends on the construct
+    table and one write per process is enough; it's rewritten if something else has since
+    deleted or touched it (e.g. generate_runtime_helpers appending to it).
+    """
+    fuzzy_file = runtime_path / "fuzzy.py"
+    stamp = _runtime_stamp(fuzzy_file)
+    if stamp is not None and _generated_runtimes.get(runtime_path) == stamp:
+        return
+    runtime_path.mkdir(parents=True, exist_ok=True)
+    generate_runtime(runtime_path)
+    _generated_runtimes[runtime_path] = _runtime_stamp(fuzzy_file)
+
+
+def _runtime_stamp(fuzzy_file: Path):
+    """(mtime, size) of a generated runtime file, or None if it doesn't exist."""
+    try:
+        stat = fuzzy_file.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def transform(input_path: Union[str, Path], out_dir: Union[str, Path]) -> List[Path]:
+    # Accept plain strings so callers (like the CLI) don't have to build Paths themselves
+    out_dir = Path(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
 
     input_path = Path(input_path)
     output_paths = []
 
     if input_path.is_dir():
-        for file in input_path.glob("**/*.knda"):
-            try:
-                output_code = transform_file(file)
-                relative_path = file.relative_to(input_path)
-
-                if file.name.endswith(".py.knda"):
-                    new_name = file.name.replace(".py.knda", ".py")
-                else:
-                    new_name = file.stem + ".py"
-
-                output_file_path = out_dir / relative_path.with_name(new_name)
-                output_file_path.parent.mkdir(parents=True, exist_ok=True)
-                output_file_path.write_text(output_code, encoding="utf-8")
-                output_paths.append(output_file_path)
-            except KindaParseError:
-                # Re-raise parse errors to be handled by CLI
-                raise
-            except Exception as e:
-                raise KindaParseError(f"Failed to process file: {str(e)}", 0, "", str(file))
+        files = list(input_path.glob("**/*.knda"))
+        workers = _worker_count(len(files))
+        if workers > 1:
+            # Files are independent and CPU-bound, so fan them out; imported here to keep
+            # multiprocessing out of CLI startup for the usual single-file case
+            from concurrent.futures import ProcessPoolExecutor
+
+            chunksize = _chunksize(len(files), workers)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(
+                    _transform_dir_entry_in_worker,
+                    files,
+                    repeat(input_path),
+                    repeat(out_dir),
+                    chunksize=chunksize,
+                )
+                for output_file_path, helpers in results:
+                    used_helpers.update(helpers)
+                    output_paths.append(output_file_path)
+        else:
+            for file in files:
+                output_paths.append(_transform_dir_entry(file, input_path, out_dir))
     else:
         try:
             output_code = transform_file(input_path)
@@ -595,9 +787,6 @@ def transform(input_path: Path, out_dir: Path) -> List[Path]:
 
     # Generate fuzzy runtime
     runtime_path = Path(__file__).parent.parent.parent / "langs" / "python" / "runtime"
-    runtime_path.mkdir(parents=True, exist_ok=True)
-
-    generate_runtime_helpers(used_helpers, runtime_path, KindaPythonConstructs)
-    generate_runtime(runtime_path)
+    _ensure_runtime(runtime_path)
 
     return output_paths
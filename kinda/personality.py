@@ -10,8 +10,12 @@ fuzzy construct behavior, randomness, and error message tone.
 import random
 import time
 from dataclasses import dataclass
+from functools import wraps
 from typing import Dict, Optional, Any, Tuple
 
+# Bumped on every profile field change; contexts drop their cached derived values when it moves
+_profile_generation = 0
+
 
 @dataclass
 class ChaosProfile:
@@ -46,6 +50,11 @@ class ChaosProfile:
     # Error message personality
     error_snark_level: float = 0.5  # How snarky error messages are (0-1)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        global _profile_generation
+        _profile_generation += 1
+        object.__setattr__(self, name, value)
+
 
 # Pre-defined personality profiles based on user feedback requirements
 PERSONALITY_PROFILES: Dict[str, ChaosProfile] = {
@@ -128,6 +137,26 @@ PERSONALITY_PROFILES: Dict[str, ChaosProfile] = {
 }
 
 
+def _profile_cached(method):
+    """Cache a getter that only depends on the profile and chaos level, per context."""
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self, *args):
+        if self._derived_generation != _profile_generation:
+            self._derived.clear()
+            self._derived_generation = _profile_generation
+        # chaos_level is part of the key since callers such as replay assign it in place
+        key = (name, self.chaos_level, *args)
+        try:
+            return self._derived[key]
+        except KeyError:
+            value = self._derived[key] = method(self, *args)
+            return value
+
+    return wrapper
+
+
 class PersonalityContext:
     """Global personality context for kinda-lang execution."""
 
@@ -142,6 +171,10 @@ class PersonalityContext:
         self.instability_level = 0.0  # For cascade failures
         self.drift_accumulator = {}  # For time-based drift
 
+        # Profile-derived ranges and base probabilities, see _profile_cached
+        self._derived: Dict[Tuple, Any] = {}
+        self._derived_generation = _profile_generation
+
         # Centralized random number generator for reproducibility
         self.seed = seed
         self.rng = random.Random(seed)  # Create seeded RNG instance
@@ -201,6 +234,19 @@ class PersonalityContext:
 
     def get_chaos_probability(self, base_key: str, condition: Any = True) -> float:
         """Get chaos-adjusted probability for a construct."""
+        adjusted = self._base_chaos_probability(base_key)
+
+        # Apply cascade effects
+        if self.instability_level > 0:
+            cascade_impact = self.instability_level * self.profile.cascade_strength
+            adjusted = adjusted * (1.0 - cascade_impact)
+
+        # Ensure probability stays in valid range (chained compares beat max/min calls here)
+        return 0.0 if adjusted < 0.0 else 1.0 if adjusted > 1.0 else adjusted
+
+    @_profile_cached
+    def _base_chaos_probability(self, base_key: str) -> float:
+        """Chaos-adjusted probability before cascade effects are applied."""
         base_prob = getattr(self.profile, f"{base_key}_base", 0.5)
 
         # Combine personality profile chaos_amplifier with chaos_level multiplier
@@ -224,14 +270,9 @@ class PersonalityContext:
             else:
                 adjusted = base_prob + (0.5 - base_prob) * (combined_chaos_amplifier - 1.0)
 
-        # Apply cascade effects
-        if self.instability_level > 0:
-            cascade_impact = self.instability_level * self.profile.cascade_strength
-            adjusted = adjusted * (1.0 - cascade_impact)
-
-        # Ensure probability stays in valid range
-        return max(0.0, min(1.0, adjusted))
+        return adjusted
 
+    @_profile_cached
     def get_fuzz_range(self, base_key: str = "int") -> Tuple[int, int]:
         """Get chaos-adjusted fuzz range."""
         base_range = getattr(self.profile, f"{base_key}_fuzz_range", (-1, 1))
@@ -278,6 +319,7 @@ class PersonalityContext:
         # Keep uncertainty within reasonable bounds
         return max(0.0, min(0.5, uncertainty))
 
+    @_profile_cached
     def get_binary_probabilities(self) -> Tuple[float, float, float]:
         """Get personality-adjusted binary probabilities (pos, neg, neutral)."""
         # Apply chaos effects to make probabilities more or less predictable
@@ -308,6 +350,12 @@ class PersonalityContext:
 
         return (pos, neg, neutral)
 
+    @_profile_cached
+    def get_binary_cdf(self) -> Tuple[float, float]:
+        """Get cumulative (pos, pos + neg) bounds for picking a binary outcome with bisect."""
+        pos, neg, _ = self.get_binary_probabilities()
+        return (pos, pos + neg)
+
     def update_instability(self, failed: bool = False) -> None:
         """Update system instability for cascade effects."""
         if failed:
@@ -415,7 +463,17 @@ class PersonalityContext:
 
     def randint(self, a: int, b: int) -> int:
         """Get a random integer from seeded RNG."""
-        return self.rng.randint(a, b)
+        span = b - a + 1
+        if type(a) is not int or type(b) is not int or span <= 0:
+            # Let random.Random produce its usual errors for bad arguments
+            return self.rng.randint(a, b)
+        if span == 1:
+            # A fixed range like 0..0 has one answer; getrandbits(0) raises on Python 3.8
+            return a
+        if not span & (span - 1):
+            # Power-of-two spans (fuzz ranges like -1..2) need no rejection sampling
+            return a + self.rng.getrandbits(span.bit_length() - 1)
+        return a + self.rng._randbelow(span)
 
     def uniform(self, a: float, b: float) -> float:
         """Get a uniform random float from seeded RNG."""
@@ -464,7 +522,8 @@ class PersonalityContext:
 # Global convenience functions for use in constructs
 def get_personality() -> PersonalityContext:
     """Get the current personality context."""
-    return PersonalityContext.get_instance()
+    # Every chaos_* helper comes through here, so skip the classmethod hop once it exists
+    return PersonalityContext._instance or PersonalityContext.get_instance()
 
 
 def chaos_probability(base_key: str, condition: Any = True) -> float:
@@ -497,6 +556,11 @@ def chaos_binary_probabilities() -> Tuple[float, float, float]:
     return get_personality().get_binary_probabilities()
 
 
+def chaos_binary_cdf() -> Tuple[float, float]:
+    """Get cumulative personality-adjusted binary probabilities."""
+    return get_personality().get_binary_cdf()
+
+
 def chaos_bool_uncertainty() -> float:
     """Get personality-adjusted boolean uncertainty."""
     return get_personality().get_bool_uncertainty()
@@ -564,3 +628,36 @@ def chaos_gauss(mu: float, sigma: float) -> float:
 def get_seed_info() -> Dict[str, Any]:
     """Get information about the current seed configuration."""
     return get_personality().get_seed_info()
+
+
+# Shared numeric core for the kinda_int, fuzzy_assign and ish_value constructs
+def fuzz_number(value: Any, label: str, variance: Optional[float] = None) -> Any:
+    """Coerce a value to a number and add personality fuzz.
+
+    Without a variance this is integer fuzz from the 'int' fuzz range and the result is
+    an int; with one it is ~ish noise in [-variance, variance], kept an int for int input.
+    Values that can't be made numeric get a "[?] <label> got something weird" message
+    and a random fallback.
+    """
+    # Exact int/float is a pointer compare; subclasses still go through isinstance
+    value_type = type(value)
+    if value_type is not int and value_type is not float and not isinstance(value, (int, float)):
+        try:
+            value = float(value)
+        except (ValueError, TypeError):
+            print(f"[?] {label} got something weird: {repr(value)}")
+            print(f"[tip] Expected a number but got {type(value).__name__}")
+            update_chaos_state(failed=True)
+            if variance is None:
+                return chaos_randint(0, 10)
+            return chaos_uniform(-variance, variance)
+
+    if variance is None:
+        fuzz_min, fuzz_max = chaos_fuzz_range("int")
+        result = int(value + chaos_randint(fuzz_min, fuzz_max))
+    else:
+        result = value + chaos_uniform(-variance, variance)
+        if isinstance(value, int):
+            result = int(result)
+    update_chaos_state(failed=False)
+    return result
@@ -15,6 +15,7 @@ Security features include:
 - Comprehensive dangerous pattern detection
 """
 
+import re
 import signal
 import unicodedata
 from typing import Any, List, Tuple
@@ -85,8 +86,6 @@ def is_condition_dangerous(condition: Any) -> Tuple[bool, str]:
     Returns:
         tuple: (is_dangerous, reason)
     """
-    import re
-
     condition_str = normalize_for_security_check(str(condition))  # Unicode-safe normalization
 
     # Check for dangerous code injection patterns with regex to handle whitespace bypasses
@@ -195,7 +194,10 @@ def secure_condition_check(condition: Any, construct_name: str) -> Tuple[bool, b
                should_proceed: False if security blocked
                condition_result: The boolean result if allowed
     """
-    import re
+    # Plain bools (what transpiled `~sometimes (x < y)` passes) can't carry code and can't
+    # hang in bool(), so they skip the pattern scan and the alarm-guarded evaluation
+    if type(condition) is bool:
+        return True, condition
 
     condition_str = normalize_for_security_check(str(condition))  # Unicode-safe normalization
 
@@ -96,7 +96,7 @@ class TestSafeReadFileEdgeCases:
 class TestShowExamples:
     """Test show_examples function"""
 
-    @patch("pathlib.Path.exists")
+    @patch("kinda.cli.os.path.exists")
     def test_show_examples_nonexistent_files(self, mock_exists):
         """Test show_examples when example files don't exist"""
         mock_exists.return_value = False
@@ -237,8 +237,8 @@ class TestRunCommandErrorHandling:
             mock_transformer.transform.return_value = [Path("/tmp/output.py")]
 
             with patch("kinda.cli.get_transformer", return_value=mock_transformer):
-                with patch("runpy.run_path") as mock_run_path:
-                    mock_run_path.side_effect = RuntimeError("Division by zero")
+                with patch("kinda.cli._run_transformed") as mock_run_transformed:
+                    mock_run_transformed.side_effect = RuntimeError("Division by zero")
                     with patch("builtins.print") as mock_print:
                         result = cli.main(["run", temp_path])
                         assert result == 1
@@ -322,7 +322,7 @@ class TestInterpretCommandErrorHandling:
 
     def test_interpret_command_file_validation_fails(self):
         """Test interpret command when file validation fails"""
-        with tempfile.NamedTemporaryFile(mode="wb", delete=False) as f:
+        with tempfile.NamedTemporaryFile(mode="wb", suffix=".knda", delete=False) as f:
             # Write binary content that should fail validation
             f.write(b"\x00\x01\x02binary content")
             temp_path = f.name
@@ -18,6 +18,10 @@ from kinda.cli import (
     get_transformer,
     safe_print,
     main,
+    _sniff_subcommand,
+    _build_parser,
+    _run_transformed,
+    _fast_parse,
 )
 
 
@@ -205,6 +209,14 @@ class TestGetTransformer:
         assert transformer is not None
         assert hasattr(transformer, "transform")
 
+    def test_get_python_transformer_is_cached(self):
+        """Test repeat lookups hand back the cached transformer module."""
+        import kinda.cli as cli
+
+        transformer = get_transformer("python")
+        assert cli._TRANSFORMERS["python"] is transformer
+        assert get_transformer("python") is transformer
+
     def test_get_c_transformer(self, capsys):
         """Test C transformer is disabled."""
         transformer = get_transformer("c")
@@ -285,6 +297,176 @@ class TestMainFunctionEdgeCases:
                 shutil.rmtree(".kinda-build")
 
 
+class TestLazyParserConstruction:
+    """Test that only the requested subcommand's parser gets built."""
+
+    def test_sniff_known_subcommand(self):
+        """Test sniffing picks up the leading subcommand."""
+        assert _sniff_subcommand(["run", "file.knda"]) == "run"
+        assert _sniff_subcommand(["record", "run", "file.knda"]) == "record"
+
+    def test_sniff_unknown_or_missing_subcommand(self):
+        """Test sniffing gives up on help flags, typos, and empty argv."""
+        assert _sniff_subcommand([]) is None
+        assert _sniff_subcommand(["--help"]) is None
+        assert _sniff_subcommand(["unknown_command", "run"]) is None
+
+    def test_build_parser_single_subcommand(self):
+        """Test a sniffed parser only knows about its own subcommand."""
+        parser = _build_parser("transform")
+        args = parser.parse_args(["transform", "x.knda", "--out", "dist"])
+        assert args.command == "transform"
+        assert args.out == "dist"
+        with pytest.raises(SystemExit):
+            parser.parse_args(["run", "x.knda"])
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["transform", "x.knda"],
+            ["transform", "x.knda", "--out", "dist", "--lang", "Python"],
+            ["run", "x.knda", "--chaos-level", "9", "--seed", "-42"],
+            ["run", "--mood=chaotic", "x.knda"],
+            ["interpret", "x.knda", "--chaos-level=1"],
+        ],
+    )
+    def test_fast_parse_matches_argparse(self, argv):
+        """Test the hand-rolled parser agrees with argparse on everyday invocations."""
+        expected = vars(_build_parser(argv[0]).parse_args(argv))
+        assert vars(_fast_parse(argv)) == expected
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            [],
+            ["--help"],
+            ["run", "--help"],
+            ["run"],
+            ["run", "a.knda", "b.knda"],
+            ["run", "x.knda", "--out", "dist"],
+            ["run", "x.knda", "--chaos-level", "11"],
+            ["run", "x.knda", "--seed", "lots"],
+            ["run", "x.knda", "--mood"],
+            ["record", "run", "x.knda"],
+        ],
+    )
+    def test_fast_parse_defers_to_argparse(self, argv):
+        """Test anything unusual is left for argparse to handle."""
+        assert _fast_parse(argv) is None
+
+    def test_build_parser_is_cached_per_command(self):
+        """Test parsers are built once per subcommand and reused."""
+        assert _build_parser("run") is _build_parser("run")
+        assert _build_parser("run") is not _build_parser("transform")
+        assert _build_parser(None) is _build_parser(None)
+
+    def test_print_only_commands_skip_parser(self, capsys):
+        """Test examples/syntax are dispatched without building a parser."""
+        with patch("kinda.cli._build_parser") as mock_build:
+            assert main(["examples"]) == 0
+            assert main(["syntax"]) == 0
+            mock_build.assert_not_called()
+        captured = capsys.readouterr()
+        assert "Hello World" in captured.out
+        assert "~kinda int" in captured.out
+
+
+class TestRunTransformed:
+    """Test executing transformed files without runpy."""
+
+    def test_runs_as_main(self, capsys):
+        """Test the file executes with __name__ and __file__ set like a script."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
+            f.write('if __name__ == "__main__":\n    print("ran", __file__)\n')
+            temp_path = Path(f.name)
+
+        try:
+            _run_transformed(temp_path)
+            captured = capsys.readouterr()
+            assert captured.out.strip() == f"ran {temp_path}"
+        finally:
+            temp_path.unlink()
+
+    def test_runs_in_main_module(self, capsys):
+        """Test the file can pickle its own classes and sees itself as sys.argv[0]."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
+            f.write(
+                "import pickle\n"
+                "import sys\n"
+                "from dataclasses import dataclass\n"
+                "\n"
+                "@dataclass\n"
+                "class Point:\n"
+                "    x: int\n"
+                "    y: int\n"
+                "\n"
+                "print(pickle.loads(pickle.dumps(Point(1, 2))))\n"
+                "print(sys.argv[0])\n"
+            )
+            temp_path = Path(f.name)
+
+        old_main = sys.modules["__main__"]
+        old_argv0 = sys.argv[0]
+        try:
+            _run_transformed(temp_path)
+            captured = capsys.readouterr()
+            assert captured.out.splitlines() == ["Point(x=1, y=2)", str(temp_path)]
+            assert sys.modules["__main__"] is old_main
+            assert sys.argv[0] == old_argv0
+        finally:
+            temp_path.unlink()
+
+    def test_runtime_errors_propagate(self):
+        """Test errors in the executed code reach the caller."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
+            f.write("1 / 0\n")
+            temp_path = Path(f.name)
+
+        try:
+            with pytest.raises(ZeroDivisionError):
+                _run_transformed(str(temp_path))
+        finally:
+            temp_path.unlink()
+
+
+class TestKndaExtensionCheck:
+    """Test inputs without a .knda extension are turned away early."""
+
+    @pytest.mark.parametrize("command", ["transform", "run", "interpret"])
+    def test_non_knda_file_rejected(self, command, capsys):
+        """Test a non-.knda file never reaches the transformer."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
+            f.write("x = 42")
+            temp_path = f.name
+
+        try:
+            with patch("kinda.cli.get_transformer") as mock_get_transformer:
+                assert main([command, temp_path]) == 1
+                mock_get_transformer.assert_not_called()
+            captured = capsys.readouterr()
+            assert "doesn't look like a .knda file" in captured.out
+        finally:
+            os.unlink(temp_path)
+
+
+class TestPlainOutputMode:
+    """Test KINDA_PLAIN=1 ASCII-only output."""
+
+    def test_plain_mode_prints_ascii_once(self):
+        """Test plain mode swaps emojis up front instead of waiting for an encode error."""
+        with patch("kinda.cli._PLAIN", True):
+            with patch("builtins.print") as mock_print:
+                safe_print("🎲 Rolled ±1 • 🚀 done")
+                mock_print.assert_called_once_with("* Rolled +/-1 - ? done")
+
+    def test_plain_mode_off_keeps_emojis(self):
+        """Test emojis pass through untouched by default."""
+        with patch("kinda.cli._PLAIN", False):
+            with patch("builtins.print") as mock_print:
+                safe_print("🎲 Rolled")
+                mock_print.assert_called_once_with("🎲 Rolled")
+
+
 class TestSafePrintEdgeCases:
     """Test safe_print function edge cases."""
 
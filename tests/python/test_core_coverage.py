@@ -54,6 +54,71 @@ class TestSortaPrintParsing:
         assert groups[0] == ""
 
 
+class TestConstructDispatch:
+    """Test the single-pass construct classification in match_python_construct"""
+
+    @pytest.mark.parametrize("line", ["total = x + 1", "print('~sorta')", "", "def f(a, b):"])
+    def test_plain_python_is_rejected(self, line):
+        """Test lines without any construct come back empty"""
+        assert match_python_construct(line) == (None, None)
+
+    def test_lines_without_tilde_skip_the_alternation(self):
+        """Test lines that can't hold a construct never reach the combined regex"""
+        with patch("kinda.grammar.python.matchers._CONSTRUCT_GATE") as gate:
+            gate.match.return_value = None
+            assert match_python_construct("total = compute(a, b) + welp") == (None, None)
+            gate.match.assert_not_called()
+
+            match_python_construct("total ~= 5")
+            gate.match.assert_called_once_with("total ~= 5")
+
+    def test_regex_constructs_take_groups_from_the_gate(self):
+        """Test constructs matched by their own pattern in the gate aren't matched a second time"""
+        with patch("kinda.grammar.python.matchers._CONSTRUCT_PATTERNS", ()):
+            assert match_python_construct("~kinda int x ~= 5;") == ("kinda_int", ("x", "5"))
+            assert match_python_construct("score ~= 3") == ("fuzzy_reassign", ("score", "3"))
+            assert match_python_construct("~kinda binary b") == ("kinda_binary", ("b", None))
+
+    def test_declaration_wins_over_reassignment(self):
+        """Test table order is kept when several constructs could match"""
+        construct_type, groups = match_python_construct("~kinda int x ~= 5;")
+
+        assert construct_type == "kinda_int"
+        assert groups == ("x", "5")
+
+    def test_unbalanced_conditional_falls_through(self):
+        """Test a conditional the parser rejects still tries the later constructs"""
+        construct_type, groups = match_python_construct("~maybe(x ~welp 1")
+
+        assert construct_type == "welp"
+        assert groups == ("~maybe(x ", "1")
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "x ~= " + " " * 20000 + "y@",
+            "~kinda int x = " + "y" * 20000 + "#",
+            "~assert_eventually(" + " " * 20000,
+            "~assert_probability(x, tolerance=1" + " " * 20000,
+            "a" * 20000 + " ~welp",
+        ],
+        ids=["reassign", "declaration", "assert_eventually", "assert_probability", "welp"],
+    )
+    def test_pathological_lines_match_in_linear_time(self, line):
+        """Test long adversarial lines don't trigger regex backtracking blowups"""
+        import time
+
+        from kinda.grammar.python.constructs import KindaPythonConstructs
+        from kinda.grammar.python.matchers import find_ish_constructs
+
+        start = time.perf_counter()
+        match_python_construct(line)
+        find_ish_constructs(line)
+        for data in KindaPythonConstructs.values():
+            data["pattern"].match(line)
+        assert time.perf_counter() - start < 1.0
+
+
 class TestTransformLineCore:
     """Test core transform_line functionality"""
 
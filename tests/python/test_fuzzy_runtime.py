@@ -525,6 +525,19 @@ class TestSometimes:
         assert sometimes([]) is False  # Falsy condition always False
         assert isinstance(sometimes([1, 2]), bool)  # Truthy but sometimes
 
+    def test_sometimes_false_condition_skips_random_draw(self):
+        """Test that a false condition returns before touching probability or RNG."""
+        from kinda.grammar.python.constructs import construct_function
+
+        sometimes = construct_function("sometimes")
+        with patch("kinda.personality.chaos_random") as draw, patch(
+            "kinda.personality.chaos_probability"
+        ) as prob:
+            assert sometimes(False) is False
+            assert sometimes(0) is False
+        draw.assert_not_called()
+        prob.assert_not_called()
+
 
 class TestSortaPrint:
     """Test sorta_print function with various inputs."""
@@ -627,6 +640,19 @@ class TestSortaPrint:
 
         sys.stdout = sys.__stdout__
 
+    def test_sorta_print_shrug_picks_from_fixed_responses(self, capsys):
+        """Test that the shrug path picks one of the five canned responses."""
+        from kinda.grammar.python.constructs import construct_function
+
+        shrug_print = construct_function("sorta_print")
+        with patch("kinda.personality.chaos_random", return_value=0.999999):
+            with patch("kinda.personality.chaos_choice", side_effect=lambda seq: seq[-1]) as pick:
+                shrug_print("hello")
+
+        (responses,), _ = pick.call_args
+        assert len(responses) == 5
+        assert capsys.readouterr().out == "[shrug] Kinda busy hello\n"
+
 
 class TestEnvironmentDict:
     """Test that all functions are properly added to the env dictionary."""
@@ -324,6 +324,18 @@ class TestIshEdgeCases:
             assert len(result) == 1
             assert expected in result[0]
 
+    def test_keyword_prefixed_variable_names(self):
+        """Test that only whole keywords, not name prefixes, mark a comparison"""
+        test_cases = [
+            ("iffy ~ish 3", "iffy = ish_value(iffy, 3)"),
+            ("returned ~ish 2", "returned = ish_value(returned, 2)"),
+            ("while_count ~ish 4", "while_count = ish_value(while_count, 4)"),
+            ("return total ~ish 4", "return ish_comparison(total, 4)"),
+        ]
+
+        for input_line, expected in test_cases:
+            assert _transform_ish_constructs(input_line) == expected
+
     def test_numeric_expressions_in_variance(self):
         """Test various numeric expressions as variance values"""
         test_cases = [
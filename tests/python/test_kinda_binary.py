@@ -103,10 +103,7 @@ class TestKindaBinaryRuntime:
     def test_kinda_binary_returns_valid_values(self):
         """Test that kinda_binary returns only 1, -1, or 0"""
         # Import the runtime generation to get the function definition
-        from kinda.grammar.python.constructs import KindaPythonConstructs
-
-        # Extract the function body and execute it
-        func_body = KindaPythonConstructs["kinda_binary"]["body"]
+        from kinda.grammar.python.constructs import construct_code
 
         # Create a namespace with random module
         import random
@@ -114,7 +111,7 @@ class TestKindaBinaryRuntime:
         namespace = {"random": random}
 
         # Execute the function definition
-        exec(func_body, namespace)
+        exec(construct_code("kinda_binary"), namespace)
         kinda_binary = namespace["kinda_binary"]
 
         # Test multiple times to ensure valid values
@@ -124,14 +121,12 @@ class TestKindaBinaryRuntime:
 
     def test_kinda_binary_distribution(self):
         """Test that distribution roughly matches specified probabilities"""
-        from kinda.grammar.python.constructs import KindaPythonConstructs
-
-        func_body = KindaPythonConstructs["kinda_binary"]["body"]
+        from kinda.grammar.python.constructs import construct_code
 
         import random
 
         namespace = {"random": random}
-        exec(func_body, namespace)
+        exec(construct_code("kinda_binary"), namespace)
         kinda_binary = namespace["kinda_binary"]
 
         # Test with custom probabilities
@@ -152,6 +147,20 @@ class TestKindaBinaryRuntime:
         assert abs(results["negative"] / iterations - 0.3) < 0.1
         assert abs(results["neutral"] / iterations - 0.2) < 0.1
 
+    def test_kinda_binary_outcome_boundaries(self):
+        """Test that each random draw maps to the right outcome at the bounds"""
+        from kinda.grammar.python.constructs import construct_function
+
+        kinda_binary = construct_function("kinda_binary")
+
+        for rand, expected in [(0.0, 1), (0.49, 1), (0.5, -1), (0.79, -1), (0.8, 0), (0.99, 0)]:
+            with patch("kinda.personality.chaos_random", return_value=rand):
+                assert kinda_binary(0.5, 0.3, 0.2) == expected
+
+        with patch("kinda.personality.chaos_binary_cdf", return_value=(0.2, 0.6)):
+            with patch("kinda.personality.chaos_random", return_value=0.3):
+                assert kinda_binary() == -1
+
 
 class TestKindaBinaryIntegration:
     """Test integration with other kinda constructs"""
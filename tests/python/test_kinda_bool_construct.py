@@ -12,7 +12,7 @@ import random
 from kinda.langs.python.transformer import transform_line, transform_file
 from kinda.grammar.python.matchers import match_python_construct
 from kinda.langs.python.runtime_gen import generate_runtime_helpers
-from kinda.grammar.python.constructs import KindaPythonConstructs
+from kinda.grammar.python.constructs import KindaPythonConstructs, construct_code
 from kinda.personality import PersonalityContext, PERSONALITY_PROFILES
 
 
@@ -155,7 +155,7 @@ class TestKindaBoolRuntime:
         """Test kinda_bool function with actual boolean values"""
         # Create namespace and execute function definition
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_bool"]["body"], test_namespace)
+        exec(construct_code("kinda_bool"), test_namespace)
         kinda_bool = test_namespace["kinda_bool"]
 
         # Test with True
@@ -173,7 +173,7 @@ class TestKindaBoolRuntime:
     def test_kinda_bool_with_integer_values(self):
         """Test kinda_bool with integer values"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_bool"]["body"], test_namespace)
+        exec(construct_code("kinda_bool"), test_namespace)
         kinda_bool = test_namespace["kinda_bool"]
 
         # Test with 1 (truthy)
@@ -191,7 +191,7 @@ class TestKindaBoolRuntime:
     def test_kinda_bool_with_string_values(self):
         """Test kinda_bool with various string values"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_bool"]["body"], test_namespace)
+        exec(construct_code("kinda_bool"), test_namespace)
         kinda_bool = test_namespace["kinda_bool"]
 
         # Test truthy strings
@@ -213,7 +213,7 @@ class TestKindaBoolRuntime:
     def test_kinda_bool_with_none(self):
         """Test kinda_bool with None value"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_bool"]["body"], test_namespace)
+        exec(construct_code("kinda_bool"), test_namespace)
         kinda_bool = test_namespace["kinda_bool"]
 
         # With None, should return random boolean
@@ -230,7 +230,7 @@ class TestKindaBoolRuntime:
     def test_kinda_bool_uncertainty_flip(self):
         """Test uncertainty causing boolean flip"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_bool"]["body"], test_namespace)
+        exec(construct_code("kinda_bool"), test_namespace)
         kinda_bool = test_namespace["kinda_bool"]
 
         # High uncertainty should cause flip
@@ -245,7 +245,7 @@ class TestKindaBoolRuntime:
     def test_kinda_bool_error_handling(self):
         """Test error handling in kinda_bool"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_bool"]["body"], test_namespace)
+        exec(construct_code("kinda_bool"), test_namespace)
         kinda_bool = test_namespace["kinda_bool"]
 
         # Test with problematic value that causes exception
@@ -367,7 +367,7 @@ class TestKindaBoolEdgeCases:
     def test_kinda_bool_with_empty_string(self):
         """Test kinda_bool with empty string"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_bool"]["body"], test_namespace)
+        exec(construct_code("kinda_bool"), test_namespace)
         kinda_bool = test_namespace["kinda_bool"]
 
         # Empty string should be falsy
@@ -379,7 +379,7 @@ class TestKindaBoolEdgeCases:
     def test_kinda_bool_with_whitespace_strings(self):
         """Test kinda_bool with whitespace strings"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_bool"]["body"], test_namespace)
+        exec(construct_code("kinda_bool"), test_namespace)
         kinda_bool = test_namespace["kinda_bool"]
 
         test_cases = [
@@ -398,7 +398,7 @@ class TestKindaBoolEdgeCases:
     def test_kinda_bool_with_ambiguous_strings(self):
         """Test kinda_bool with ambiguous string values"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_bool"]["body"], test_namespace)
+        exec(construct_code("kinda_bool"), test_namespace)
         kinda_bool = test_namespace["kinda_bool"]
 
         # Non-empty but ambiguous strings should be truthy (like standard Python)
@@ -413,7 +413,7 @@ class TestKindaBoolEdgeCases:
     def test_kinda_bool_with_numeric_edge_cases(self):
         """Test kinda_bool with edge case numeric values"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_bool"]["body"], test_namespace)
+        exec(construct_code("kinda_bool"), test_namespace)
         kinda_bool = test_namespace["kinda_bool"]
 
         test_cases = [
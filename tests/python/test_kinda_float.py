@@ -13,7 +13,7 @@ import math
 from kinda.langs.python.transformer import transform_line, transform_file
 from kinda.grammar.python.matchers import match_python_construct
 from kinda.langs.python.runtime_gen import generate_runtime_helpers
-from kinda.grammar.python.constructs import KindaPythonConstructs
+from kinda.grammar.python.constructs import KindaPythonConstructs, construct_code
 from kinda.personality import PersonalityContext, PERSONALITY_PROFILES
 
 
@@ -171,7 +171,7 @@ class TestKindaFloatRuntime:
         """Test kinda_float function with actual float values"""
         # Create namespace and execute function definition
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_float"]["body"], test_namespace)
+        exec(construct_code("kinda_float"), test_namespace)
         kinda_float = test_namespace["kinda_float"]
 
         # Test with positive float
@@ -191,7 +191,7 @@ class TestKindaFloatRuntime:
     def test_kinda_float_with_integer_values(self):
         """Test kinda_float with integer input values"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_float"]["body"], test_namespace)
+        exec(construct_code("kinda_float"), test_namespace)
         kinda_float = test_namespace["kinda_float"]
 
         # Test with integer input
@@ -204,7 +204,7 @@ class TestKindaFloatRuntime:
     def test_kinda_float_with_string_values(self):
         """Test kinda_float with string numeric values"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_float"]["body"], test_namespace)
+        exec(construct_code("kinda_float"), test_namespace)
         kinda_float = test_namespace["kinda_float"]
 
         # Test with string representation of float
@@ -226,7 +226,7 @@ class TestKindaFloatRuntime:
     def test_kinda_float_scientific_notation(self):
         """Test kinda_float with scientific notation"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_float"]["body"], test_namespace)
+        exec(construct_code("kinda_float"), test_namespace)
         kinda_float = test_namespace["kinda_float"]
 
         # Test with scientific notation
@@ -245,7 +245,7 @@ class TestKindaFloatRuntime:
     def test_kinda_float_with_invalid_string(self):
         """Test kinda_float with non-numeric string"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_float"]["body"], test_namespace)
+        exec(construct_code("kinda_float"), test_namespace)
         kinda_float = test_namespace["kinda_float"]
 
         # Test with invalid string should return random float
@@ -258,7 +258,7 @@ class TestKindaFloatRuntime:
     def test_kinda_float_drift_application(self):
         """Test that drift is properly applied"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_float"]["body"], test_namespace)
+        exec(construct_code("kinda_float"), test_namespace)
         kinda_float = test_namespace["kinda_float"]
 
         # Test positive drift
@@ -276,7 +276,7 @@ class TestKindaFloatRuntime:
     def test_kinda_float_zero_handling(self):
         """Test kinda_float with zero values"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_float"]["body"], test_namespace)
+        exec(construct_code("kinda_float"), test_namespace)
         kinda_float = test_namespace["kinda_float"]
 
         # Test with zero
@@ -296,7 +296,7 @@ class TestKindaFloatRuntime:
     def test_kinda_float_error_handling(self):
         """Test error handling in kinda_float"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_float"]["body"], test_namespace)
+        exec(construct_code("kinda_float"), test_namespace)
         kinda_float = test_namespace["kinda_float"]
 
         # Test with problematic value that causes exception
@@ -454,7 +454,7 @@ class TestKindaFloatEdgeCases:
     def test_kinda_float_with_infinity(self):
         """Test kinda_float with infinity values"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_float"]["body"], test_namespace)
+        exec(construct_code("kinda_float"), test_namespace)
         kinda_float = test_namespace["kinda_float"]
 
         # Test with positive infinity
@@ -472,7 +472,7 @@ class TestKindaFloatEdgeCases:
     def test_kinda_float_with_nan(self):
         """Test kinda_float with NaN values"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_float"]["body"], test_namespace)
+        exec(construct_code("kinda_float"), test_namespace)
         kinda_float = test_namespace["kinda_float"]
 
         # Test with NaN - should handle gracefully
@@ -485,7 +485,7 @@ class TestKindaFloatEdgeCases:
     def test_kinda_float_very_large_numbers(self):
         """Test kinda_float with very large numbers"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_float"]["body"], test_namespace)
+        exec(construct_code("kinda_float"), test_namespace)
         kinda_float = test_namespace["kinda_float"]
 
         # Test with very large number
@@ -499,7 +499,7 @@ class TestKindaFloatEdgeCases:
     def test_kinda_float_very_small_numbers(self):
         """Test kinda_float with very small numbers"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_float"]["body"], test_namespace)
+        exec(construct_code("kinda_float"), test_namespace)
         kinda_float = test_namespace["kinda_float"]
 
         # Test with very small number
@@ -513,7 +513,7 @@ class TestKindaFloatEdgeCases:
     def test_kinda_float_precision_handling(self):
         """Test floating-point precision considerations"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_float"]["body"], test_namespace)
+        exec(construct_code("kinda_float"), test_namespace)
         kinda_float = test_namespace["kinda_float"]
 
         # Test that we maintain reasonable precision
@@ -635,7 +635,7 @@ class TestKindaFloatSpecialValues:
     def test_kinda_float_with_pi_approximation(self):
         """Test kinda_float with pi-like values"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_float"]["body"], test_namespace)
+        exec(construct_code("kinda_float"), test_namespace)
         kinda_float = test_namespace["kinda_float"]
 
         pi_approx = 3.14159
@@ -648,7 +648,7 @@ class TestKindaFloatSpecialValues:
     def test_kinda_float_with_e_approximation(self):
         """Test kinda_float with e-like values"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_float"]["body"], test_namespace)
+        exec(construct_code("kinda_float"), test_namespace)
         kinda_float = test_namespace["kinda_float"]
 
         e_approx = 2.71828
@@ -661,7 +661,7 @@ class TestKindaFloatSpecialValues:
     def test_kinda_float_fractional_values(self):
         """Test kinda_float with common fractional values"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_float"]["body"], test_namespace)
+        exec(construct_code("kinda_float"), test_namespace)
         kinda_float = test_namespace["kinda_float"]
 
         # Test 1/3
@@ -691,7 +691,7 @@ class TestKindaFloatDriftBehavior:
     def test_drift_maintains_sign_for_small_values(self):
         """Test that drift doesn't inappropriately flip signs for small values"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_float"]["body"], test_namespace)
+        exec(construct_code("kinda_float"), test_namespace)
         kinda_float = test_namespace["kinda_float"]
 
         # Small positive value shouldn't become negative with reasonable drift
@@ -703,7 +703,7 @@ class TestKindaFloatDriftBehavior:
     def test_drift_can_flip_signs_for_very_small_values(self):
         """Test that drift can flip signs for very small values (expected behavior)"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_float"]["body"], test_namespace)
+        exec(construct_code("kinda_float"), test_namespace)
         kinda_float = test_namespace["kinda_float"]
 
         # Very small positive value can become negative with large enough drift
@@ -715,7 +715,7 @@ class TestKindaFloatDriftBehavior:
     def test_multiple_calls_produce_different_results(self):
         """Test that multiple calls with same input produce different results due to drift"""
         test_namespace = {}
-        exec(KindaPythonConstructs["kinda_float"]["body"], test_namespace)
+        exec(construct_code("kinda_float"), test_namespace)
         kinda_float = test_namespace["kinda_float"]
 
         # Multiple calls should produce different results
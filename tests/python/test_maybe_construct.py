@@ -9,10 +9,11 @@ from pathlib import Path
 from unittest.mock import patch
 import random
 
-from kinda.langs.python.transformer import transform_line, transform_file
+from kinda.langs.python.transformer import transform_line, transform_source
 from kinda.grammar.python.matchers import match_python_construct
 from kinda.langs.python.runtime_gen import generate_runtime_helpers
 from kinda.grammar.python.constructs import KindaPythonConstructs
+from tests.python.utils import assert_all_in
 
 
 class TestMaybeConstructParsing:
@@ -110,87 +111,66 @@ class TestMaybeFileTransformation:
 
     def test_maybe_block_transformation(self):
         """Test ~maybe block transformation with indented content"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".knda", delete=False) as f:
-            f.write(
-                """~kinda int x = 5
+        result = transform_source(
+            """~kinda int x = 5
 ~maybe (x > 0) {
     ~sorta print("x is positive")
     x ~= 10
 }
 print("done")
-"""
-            )
-            temp_path = Path(f.name)
-
-        try:
-            result = transform_file(temp_path)
+""",
+            "test.knda",
+        )
 
-            # Should include import for maybe and other used helpers
-            assert "from kinda.langs.python.runtime.fuzzy import" in result
-            assert "maybe" in result
+        # Should include import for maybe and other used helpers
+        assert "from kinda.langs.python.runtime.fuzzy import" in result
+        assert "maybe" in result
 
-            # Should transform the block correctly
-            assert "if maybe(x > 0):" in result
-            assert "    sorta_print(" in result
-            assert "    x = fuzzy_assign(" in result
+        # Should transform the block correctly
+        assert "if maybe(x > 0):" in result
+        assert "    sorta_print(" in result
+        assert "    x = fuzzy_assign(" in result
 
-            # Should preserve non-kinda code
-            assert 'print("done")' in result
-
-        finally:
-            temp_path.unlink()
+        # Should preserve non-kinda code
+        assert 'print("done")' in result
 
     def test_maybe_nested_constructs(self):
         """Test ~maybe with nested kinda constructs"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".knda", delete=False) as f:
-            f.write(
-                """~maybe (True) {
+        result = transform_source(
+            """~maybe (True) {
     ~kinda int nested_var = 42
     ~sometimes (nested_var > 0) {
         ~sorta print("nested execution")
     }
 }
-"""
-            )
-            temp_path = Path(f.name)
+""",
+            "test.knda",
+        )
 
-        try:
-            result = transform_file(temp_path)
-
-            # Should handle nested constructs
-            assert "if maybe(True):" in result
-            assert "    nested_var = kinda_int(42)" in result
-            assert "    if sometimes(nested_var > 0):" in result
-            assert "        sorta_print(" in result
-
-        finally:
-            temp_path.unlink()
+        # Should handle nested constructs
+        assert "if maybe(True):" in result
+        assert "    nested_var = kinda_int(42)" in result
+        assert "    if sometimes(nested_var > 0):" in result
+        assert "        sorta_print(" in result
 
     def test_maybe_multiple_blocks(self):
         """Test multiple ~maybe blocks in same file"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".knda", delete=False) as f:
-            f.write(
-                """~maybe (condition1) {
+        result = transform_source(
+            """~maybe (condition1) {
     ~sorta print("first block")
 }
 
 ~maybe (condition2) {
     ~sorta print("second block")
 }
-"""
-            )
-            temp_path = Path(f.name)
-
-        try:
-            result = transform_file(temp_path)
+""",
+            "test.knda",
+        )
 
-            # Should handle multiple blocks
-            assert "if maybe(condition1):" in result
-            assert "if maybe(condition2):" in result
-            assert result.count("maybe") >= 2
-
-        finally:
-            temp_path.unlink()
+        # Should handle multiple blocks
+        assert "if maybe(condition1):" in result
+        assert "if maybe(condition2):" in result
+        assert result.count("maybe") >= 2
 
 
 class TestMaybeRuntimeBehavior:
@@ -309,46 +289,32 @@ class TestMaybeEdgeCases:
 
     def test_maybe_with_comments(self):
         """Test ~maybe with comments in the block"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".knda", delete=False) as f:
-            f.write(
-                """~maybe (True) {
+        result = transform_source(
+            """~maybe (True) {
     # This is a comment
     ~sorta print("with comment")
     # Another comment
 }
-"""
-            )
-            temp_path = Path(f.name)
-
-        try:
-            result = transform_file(temp_path)
-
-            # Should preserve comments
-            assert "# This is a comment" in result
-            assert "# Another comment" in result
-            assert "if maybe(True):" in result
+""",
+            "test.knda",
+        )
 
-        finally:
-            temp_path.unlink()
+        # Should preserve comments
+        assert "# This is a comment" in result
+        assert "# Another comment" in result
+        assert "if maybe(True):" in result
 
     def test_maybe_empty_block(self):
         """Test ~maybe with empty block"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".knda", delete=False) as f:
-            f.write(
-                """~maybe (True) {
+        result = transform_source(
+            """~maybe (True) {
 }
-"""
-            )
-            temp_path = Path(f.name)
-
-        try:
-            result = transform_file(temp_path)
+""",
+            "test.knda",
+        )
 
-            # Should handle empty blocks gracefully
-            assert "if maybe(True):" in result
-
-        finally:
-            temp_path.unlink()
+        # Should handle empty blocks gracefully
+        assert "if maybe(True):" in result
 
 
 class TestMaybeIntegration:
@@ -356,9 +322,8 @@ class TestMaybeIntegration:
 
     def test_maybe_with_all_constructs(self):
         """Test ~maybe works alongside all other kinda constructs"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".knda", delete=False) as f:
-            f.write(
-                """~kinda int base_val = 10
+        result = transform_source(
+            """~kinda int base_val = 10
 base_val ~= 5
 
 ~maybe (base_val > 0) {
@@ -369,33 +334,37 @@ base_val ~= 5
         ~sorta print("Sometimes in maybe")
     }
 }
-"""
-            )
-            temp_path = Path(f.name)
-
-        try:
-            result = transform_file(temp_path)
-
-            # Should include all necessary imports
-            import_line = [
-                line
-                for line in result.split("\n")
-                if line.startswith("from kinda.langs.python.runtime.fuzzy import")
-            ][0]
-            assert "maybe" in import_line
-            assert "sometimes" in import_line
-            assert "kinda_int" in import_line
-            assert "sorta_print" in import_line
-            assert "fuzzy_assign" in import_line
-
-            # Should transform all constructs correctly
-            assert "base_val = kinda_int(10)" in result
-            assert "base_val = fuzzy_assign(" in result
-            assert "if maybe(base_val > 0):" in result
-            assert "if sometimes(True):" in result
-
-        finally:
-            temp_path.unlink()
+""",
+            "test.knda",
+        )
+
+        # Should include all necessary imports
+        import_line = [
+            line
+            for line in result.split("\n")
+            if line.startswith("from kinda.langs.python.runtime.fuzzy import")
+        ][0]
+        assert_all_in(
+            [
+                "maybe",
+                "sometimes",
+                "kinda_int",
+                "sorta_print",
+                "fuzzy_assign",
+            ],
+            import_line,
+        )
+
+        # Should transform all constructs correctly
+        assert_all_in(
+            [
+                "base_val = kinda_int(10)",
+                "base_val = fuzzy_assign(",
+                "if maybe(base_val > 0):",
+                "if sometimes(True):",
+            ],
+            result,
+        )
 
     def test_maybe_probability_difference_from_sometimes(self):
         """Test that ~maybe has different probability behavior than ~sometimes with personality system"""
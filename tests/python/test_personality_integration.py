@@ -7,12 +7,15 @@ Ensures that different personality moods actually affect construct behavior.
 import pytest
 import random
 from pathlib import Path
+from unittest.mock import patch
 from kinda.personality import (
     PersonalityContext,
     PERSONALITY_PROFILES,
     chaos_probability,
     chaos_fuzz_range,
     chaos_variance,
+    fuzz_number,
+    get_personality,
 )
 from kinda.cli import setup_personality
 
@@ -61,6 +64,16 @@ class TestPersonalityContext:
         ctx2 = PersonalityContext.get_instance()
         assert ctx1 is ctx2
 
+    def test_get_personality_tracks_singleton(self):
+        """Ensure get_personality creates the context and follows replacements."""
+        PersonalityContext._instance = None
+        ctx = get_personality()
+        assert ctx is PersonalityContext.get_instance()
+
+        PersonalityContext.set_mood("reliable")
+        assert get_personality() is PersonalityContext._instance
+        assert get_personality() is not ctx
+
     def test_mood_setting(self):
         """Test setting different moods."""
         PersonalityContext.set_mood("reliable")
@@ -103,6 +116,53 @@ class TestPersonalityContext:
         reliable_width = reliable_range[1] - reliable_range[0]
         assert chaotic_width > reliable_width
 
+    def test_cached_ranges_follow_profile_changes(self):
+        """Ensure cached derived values are refreshed when a profile field changes."""
+        PersonalityContext.set_mood("playful")
+        ctx = PersonalityContext.get_instance()
+        profile = ctx.profile
+        original = profile.int_fuzz_range
+        assert ctx.get_fuzz_range("int") == ctx.get_fuzz_range("int")
+
+        try:
+            profile.int_fuzz_range = (-7, 7)
+            low, high = ctx.get_fuzz_range("int")
+            assert low < original[0] and high > original[1]
+        finally:
+            profile.int_fuzz_range = original
+        assert ctx.get_fuzz_range("int")[1] < high
+
+    def test_randint_covers_inclusive_range(self):
+        """Test randint stays inclusive for power-of-two and other spans."""
+        ctx = PersonalityContext("playful", 5, seed=7)
+        for low, high in [(0, 0), (-2, 1), (-1, 1), (3, 9)]:
+            seen = {ctx.randint(low, high) for _ in range(500)}
+            assert seen == set(range(low, high + 1))
+
+        with pytest.raises(ValueError):
+            ctx.randint(2, 1)
+
+    def test_fixed_fuzz_range_adds_no_fuzz(self):
+        """Test a (0, 0) fuzz range leaves ints alone without drawing zero random bits."""
+        PersonalityContext.set_mood("playful")
+        ctx = PersonalityContext.get_instance()
+        profile = ctx.profile
+        original = profile.int_fuzz_range
+
+        def getrandbits(k):
+            # Python 3.8 rejects getrandbits(0); fail the same way on every version
+            if k <= 0:
+                raise ValueError("number of bits must be greater than zero")
+            return random.getrandbits(k)
+
+        try:
+            profile.int_fuzz_range = (0, 0)
+            with patch.object(ctx.rng, "getrandbits", side_effect=getrandbits):
+                assert ctx.randint(0, 0) == 0
+                assert all(fuzz_number(5, "kinda int") == 5 for _ in range(20))
+        finally:
+            profile.int_fuzz_range = original
+
     def test_instability_tracking(self):
         """Test that instability tracking works."""
         PersonalityContext.set_mood("playful")
@@ -181,6 +241,35 @@ class TestConstructIntegration:
         assert reliable_variance != chaotic_variance
         assert chaotic_variance > reliable_variance
 
+    def test_fuzz_number_function(self, capsys):
+        """Test the shared numeric core of kinda_int/fuzzy_assign/ish_value."""
+        with patch("kinda.personality.chaos_randint", return_value=2) as randint:
+            assert fuzz_number(5, "kinda int") == 7
+            assert fuzz_number("4.5", "kinda int") == 6
+            assert fuzz_number("nope", "kinda int") == 2
+            randint.assert_called_with(0, 10)
+
+        with patch("kinda.personality.chaos_uniform", return_value=0.75):
+            assert fuzz_number(10, "ish value", 1.0) == 10
+            assert fuzz_number(10.0, "ish value", 1.0) == 10.75
+
+        assert "[?] kinda int got something weird: 'nope'" in capsys.readouterr().out
+
+    def test_fuzz_number_accepts_numeric_subclasses(self, capsys):
+        """Test that bools and int/float subclasses skip coercion like plain numbers."""
+
+        class Meters(float):
+            pass
+
+        with patch("kinda.personality.chaos_randint", return_value=1):
+            assert fuzz_number(True, "kinda int") == 2
+            assert fuzz_number(Meters(2.5), "kinda int") == 3
+
+        with patch("kinda.personality.chaos_uniform", return_value=0.5):
+            assert fuzz_number(False, "ish value", 1.0) == 0
+
+        assert capsys.readouterr().out == ""
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -9,10 +9,11 @@ from pathlib import Path
 from unittest.mock import patch
 import random
 
-from kinda.langs.python.transformer import transform_line, transform_file
+from kinda.langs.python.transformer import transform_line, transform_source
 from kinda.grammar.python.matchers import match_python_construct
 from kinda.langs.python.runtime_gen import generate_runtime_helpers
 from kinda.grammar.python.constructs import KindaPythonConstructs
+from tests.python.utils import assert_all_in
 
 
 class TestProbablyConstructParsing:
@@ -110,87 +111,66 @@ class TestProbablyFileTransformation:
 
     def test_probably_block_transformation(self):
         """Test ~probably block transformation with indented content"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".knda", delete=False) as f:
-            f.write(
-                """~kinda int x = 5
+        result = transform_source(
+            """~kinda int x = 5
 ~probably (x > 0) {
     ~sorta print("x is positive")
     x ~= 10
 }
 print("done")
-"""
-            )
-            temp_path = Path(f.name)
-
-        try:
-            result = transform_file(temp_path)
-
-            # Should include import for probably and other used helpers
-            assert "from kinda.langs.python.runtime.fuzzy import" in result
-            assert "probably" in result
+""",
+            "test.knda",
+        )
 
-            # Should transform the block correctly
-            assert "if probably(x > 0):" in result
-            assert "    sorta_print(" in result
-            assert "    x = fuzzy_assign(" in result
+        # Should include import for probably and other used helpers
+        assert "from kinda.langs.python.runtime.fuzzy import" in result
+        assert "probably" in result
 
-            # Should preserve non-kinda code
-            assert 'print("done")' in result
+        # Should transform the block correctly
+        assert "if probably(x > 0):" in result
+        assert "    sorta_print(" in result
+        assert "    x = fuzzy_assign(" in result
 
-        finally:
-            temp_path.unlink()
+        # Should preserve non-kinda code
+        assert 'print("done")' in result
 
     def test_probably_nested_constructs(self):
         """Test ~probably with nested kinda constructs"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".knda", delete=False) as f:
-            f.write(
-                """~probably (True) {
+        result = transform_source(
+            """~probably (True) {
     ~kinda int nested_var = 42
     ~sometimes (nested_var > 0) {
         ~sorta print("nested execution")
     }
 }
-"""
-            )
-            temp_path = Path(f.name)
-
-        try:
-            result = transform_file(temp_path)
-
-            # Should handle nested constructs
-            assert "if probably(True):" in result
-            assert "    nested_var = kinda_int(42)" in result
-            assert "    if sometimes(nested_var > 0):" in result
-            assert "        sorta_print(" in result
+""",
+            "test.knda",
+        )
 
-        finally:
-            temp_path.unlink()
+        # Should handle nested constructs
+        assert "if probably(True):" in result
+        assert "    nested_var = kinda_int(42)" in result
+        assert "    if sometimes(nested_var > 0):" in result
+        assert "        sorta_print(" in result
 
     def test_probably_multiple_blocks(self):
         """Test multiple ~probably blocks in same file"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".knda", delete=False) as f:
-            f.write(
-                """~probably (condition1) {
+        result = transform_source(
+            """~probably (condition1) {
     ~sorta print("first block")
 }
 
 ~probably (condition2) {
     ~sorta print("second block")
 }
-"""
-            )
-            temp_path = Path(f.name)
-
-        try:
-            result = transform_file(temp_path)
-
-            # Should handle multiple blocks
-            assert "if probably(condition1):" in result
-            assert "if probably(condition2):" in result
-            assert result.count("probably") >= 2
+""",
+            "test.knda",
+        )
 
-        finally:
-            temp_path.unlink()
+        # Should handle multiple blocks
+        assert "if probably(condition1):" in result
+        assert "if probably(condition2):" in result
+        assert result.count("probably") >= 2
 
 
 class TestProbablyRuntimeBehavior:
@@ -365,46 +345,32 @@ class TestProbablyEdgeCases:
 
     def test_probably_with_comments(self):
         """Test ~probably with comments in the block"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".knda", delete=False) as f:
-            f.write(
-                """~probably (True) {
+        result = transform_source(
+            """~probably (True) {
     # This is a comment
     ~sorta print("with comment")
     # Another comment
 }
-"""
-            )
-            temp_path = Path(f.name)
-
-        try:
-            result = transform_file(temp_path)
-
-            # Should preserve comments
-            assert "# This is a comment" in result
-            assert "# Another comment" in result
-            assert "if probably(True):" in result
+""",
+            "test.knda",
+        )
 
-        finally:
-            temp_path.unlink()
+        # Should preserve comments
+        assert "# This is a comment" in result
+        assert "# Another comment" in result
+        assert "if probably(True):" in result
 
     def test_probably_empty_block(self):
         """Test ~probably with empty block"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".knda", delete=False) as f:
-            f.write(
-                """~probably (True) {
+        result = transform_source(
+            """~probably (True) {
 }
-"""
-            )
-            temp_path = Path(f.name)
-
-        try:
-            result = transform_file(temp_path)
-
-            # Should handle empty blocks gracefully
-            assert "if probably(True):" in result
+""",
+            "test.knda",
+        )
 
-        finally:
-            temp_path.unlink()
+        # Should handle empty blocks gracefully
+        assert "if probably(True):" in result
 
 
 class TestProbablyIntegration:
@@ -412,9 +378,8 @@ class TestProbablyIntegration:
 
     def test_probably_with_all_constructs(self):
         """Test ~probably works alongside all other kinda constructs"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".knda", delete=False) as f:
-            f.write(
-                """~kinda int base_val = 10
+        result = transform_source(
+            """~kinda int base_val = 10
 base_val ~= 5
 
 ~probably (base_val > 0) {
@@ -428,35 +393,39 @@ base_val ~= 5
         ~sorta print("Maybe in probably")
     }
 }
-"""
-            )
-            temp_path = Path(f.name)
-
-        try:
-            result = transform_file(temp_path)
-
-            # Should include all necessary imports
-            import_line = [
-                line
-                for line in result.split("\n")
-                if line.startswith("from kinda.langs.python.runtime.fuzzy import")
-            ][0]
-            assert "probably" in import_line
-            assert "sometimes" in import_line
-            assert "maybe" in import_line
-            assert "kinda_int" in import_line
-            assert "sorta_print" in import_line
-            assert "fuzzy_assign" in import_line
-
-            # Should transform all constructs correctly
-            assert "base_val = kinda_int(10)" in result
-            assert "base_val = fuzzy_assign(" in result
-            assert "if probably(base_val > 0):" in result
-            assert "if sometimes(True):" in result
-            assert "if maybe(inner_val > 15):" in result
-
-        finally:
-            temp_path.unlink()
+""",
+            "test.knda",
+        )
+
+        # Should include all necessary imports
+        import_line = [
+            line
+            for line in result.split("\n")
+            if line.startswith("from kinda.langs.python.runtime.fuzzy import")
+        ][0]
+        assert_all_in(
+            [
+                "probably",
+                "sometimes",
+                "maybe",
+                "kinda_int",
+                "sorta_print",
+                "fuzzy_assign",
+            ],
+            import_line,
+        )
+
+        # Should transform all constructs correctly
+        assert_all_in(
+            [
+                "base_val = kinda_int(10)",
+                "base_val = fuzzy_assign(",
+                "if probably(base_val > 0):",
+                "if sometimes(True):",
+                "if maybe(inner_val > 15):",
+            ],
+            result,
+        )
 
     def test_probably_probability_difference_from_other_constructs(self):
         """Test that ~probably has different probability behavior than other constructs with personality system"""
@@ -565,15 +534,11 @@ class TestProbablySecurityProtection:
 
     def test_code_injection_protection(self):
         """Test ~probably blocks dangerous code injection attempts"""
-        from kinda.grammar.python.constructs import KindaPythonConstructs
+        from kinda.grammar.python.constructs import construct_code
         import random
 
-        # Get the probably function
-        probably_construct = KindaPythonConstructs["probably"]
-        probably_code = probably_construct["body"]
-
         # Execute the probably function definition
-        exec(probably_code, globals())
+        exec(construct_code("probably"), globals())
 
         # Test dangerous imports are blocked
         dangerous_conditions = [
@@ -595,14 +560,10 @@ class TestProbablySecurityProtection:
 
     def test_deterministic_subversion_protection(self):
         """Test ~probably blocks attempts to manipulate random number generation"""
-        from kinda.grammar.python.constructs import KindaPythonConstructs
-
-        # Get the probably function
-        probably_construct = KindaPythonConstructs["probably"]
-        probably_code = probably_construct["body"]
+        from kinda.grammar.python.constructs import construct_code
 
         # Execute the probably function definition
-        exec(probably_code, globals())
+        exec(construct_code("probably"), globals())
 
         # Test random manipulation attempts are blocked
         random_manipulation_conditions = [
@@ -617,16 +578,12 @@ class TestProbablySecurityProtection:
 
     def test_resource_exhaustion_protection(self):
         """Test ~probably blocks conditions that could cause resource exhaustion"""
-        from kinda.grammar.python.constructs import KindaPythonConstructs
+        from kinda.grammar.python.constructs import construct_code
         import signal
         import time
 
-        # Get the probably function
-        probably_construct = KindaPythonConstructs["probably"]
-        probably_code = probably_construct["body"]
-
         # Execute the probably function definition
-        exec(probably_code, globals())
+        exec(construct_code("probably"), globals())
 
         # Create a condition that would normally take a very long time to evaluate
         class SlowCondition:
@@ -655,14 +612,10 @@ class TestProbablySecurityProtection:
 
     def test_security_messages_displayed(self, capsys):
         """Test that appropriate security messages are displayed when blocking attacks"""
-        from kinda.grammar.python.constructs import KindaPythonConstructs
-
-        # Get the probably function
-        probably_construct = KindaPythonConstructs["probably"]
-        probably_code = probably_construct["body"]
+        from kinda.grammar.python.constructs import construct_code
 
         # Execute the probably function definition
-        exec(probably_code, globals())
+        exec(construct_code("probably"), globals())
 
         # Test code injection security message
         probably("__import__('os')")
@@ -700,15 +653,11 @@ class TestProbablySecurityProtection:
 
     def test_legitimate_conditions_still_work(self):
         """Test that legitimate conditions still work after security fixes"""
-        from kinda.grammar.python.constructs import KindaPythonConstructs
+        from kinda.grammar.python.constructs import construct_code
         import unittest.mock
 
-        # Get the probably function
-        probably_construct = KindaPythonConstructs["probably"]
-        probably_code = probably_construct["body"]
-
         # Execute the probably function definition
-        exec(probably_code, globals())
+        exec(construct_code("probably"), globals())
 
         # Test legitimate conditions
         legitimate_conditions = [
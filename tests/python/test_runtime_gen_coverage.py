@@ -6,7 +6,11 @@ import sys
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 from kinda.langs.python.runtime_gen import generate_runtime_helpers, generate_runtime
-from kinda.grammar.python.constructs import KindaPythonConstructs
+from kinda.grammar.python.constructs import (
+    KindaPythonConstructs,
+    construct_code,
+    construct_function,
+)
 
 
 class TestRuntimeGenerationCoverage:
@@ -201,3 +205,28 @@ class TestRuntimeGenerationCoverage:
                 assert "return param * 2" in content
                 # Should extract function name and add to env
                 assert 'env["extracted_func_name"] = extracted_func_name' in content
+
+
+class TestConstructCode:
+    """Test precompiled construct bodies"""
+
+    def test_construct_code_is_compiled_once(self):
+        """Test the same code object comes back for repeated lookups"""
+        code = construct_code("kinda_int")
+        assert code is construct_code("kinda_int")
+        assert code.co_filename == "<kinda:kinda_int>"
+
+    @pytest.mark.parametrize("name", sorted(KindaPythonConstructs))
+    def test_construct_code_defines_function(self, name):
+        """Test exec of the code object defines the same function as the body"""
+        namespace = {}
+        exec(construct_code(name), namespace)
+        func_name = KindaPythonConstructs[name]["body"].split("def ")[1].split("(")[0]
+        assert callable(namespace[func_name])
+
+    def test_construct_function_is_built_once(self):
+        """Test the helper function object is cached and usable directly"""
+        func = construct_function("fuzzy_reassign")
+        assert func is construct_function("fuzzy_reassign")
+        assert func.__name__ == "fuzzy_assign"
+        assert isinstance(func("x", 5), int)
@@ -65,6 +65,16 @@ class TestEvaluate:
         # Clean up
         semantics.env.clear()
 
+    def test_evaluate_reuses_compiled_expression(self):
+        """Test that evaluating the same expression again doesn't recompile it."""
+        semantics.env["x"] = 1
+        assert semantics.evaluate("x + 1") == 2
+        semantics.env["x"] = 5
+        assert semantics.evaluate("x + 1") == 6
+        assert semantics._compile_expr("x + 1") is semantics._compile_expr("x + 1")
+
+        semantics.env.clear()
+
 
 class TestKindaAssign:
     """Test the kinda_assign function."""
@@ -282,3 +292,22 @@ class TestRunSometimesBlock:
                 assert "[sometimes] condition false" in output
 
         sys.stdout = sys.__stdout__
+
+    def test_run_sometimes_block_binds_process_line_once(self):
+        """Test the interpreter's process_line is imported once, not per block line."""
+        import types
+
+        processed = []
+        fake_main = types.ModuleType("kinda.interpreter.__main__")
+        fake_main.process_line = processed.append
+
+        with patch.dict(sys.modules, {"kinda.interpreter.__main__": fake_main}):
+            with patch.object(semantics, "_process_line", None):
+                with patch("kinda.langs.python.semantics.evaluate", return_value=True):
+                    with patch("kinda.langs.python.semantics.chaos_random", return_value=0.5):
+                        semantics.run_sometimes_block("True", ["  a = 1", "b = 2  "])
+                        # A second block reuses the bound function without importing again
+                        del fake_main.process_line
+                        semantics.run_sometimes_block("True", ["c = 3"])
+
+        assert processed == ["a = 1", "b = 2", "c = 3"]
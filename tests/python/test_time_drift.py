@@ -13,7 +13,7 @@ import random
 from kinda.langs.python.transformer import transform_line, transform_file
 from kinda.grammar.python.matchers import match_python_construct
 from kinda.langs.python.runtime_gen import generate_runtime_helpers
-from kinda.grammar.python.constructs import KindaPythonConstructs
+from kinda.grammar.python.constructs import KindaPythonConstructs, construct_code
 from kinda.personality import (
     PersonalityContext,
     PERSONALITY_PROFILES,
@@ -202,7 +202,7 @@ class TestTimeDriftFloatConstruct:
         """Test time_drift_float function behavior"""
         # Create namespace and execute function definition
         test_namespace = {}
-        exec(KindaPythonConstructs["time_drift_float"]["body"], test_namespace)
+        exec(construct_code("time_drift_float"), test_namespace)
         time_drift_float = test_namespace["time_drift_float"]
 
         # Mock the personality functions
@@ -222,7 +222,7 @@ class TestTimeDriftFloatConstruct:
     def test_time_drift_float_with_string_values(self):
         """Test time_drift_float with string numeric values"""
         test_namespace = {}
-        exec(KindaPythonConstructs["time_drift_float"]["body"], test_namespace)
+        exec(construct_code("time_drift_float"), test_namespace)
         time_drift_float = test_namespace["time_drift_float"]
 
         with patch("kinda.personality.register_time_variable"):
@@ -236,7 +236,7 @@ class TestTimeDriftFloatConstruct:
     def test_time_drift_float_error_handling(self):
         """Test error handling in time_drift_float"""
         test_namespace = {}
-        exec(KindaPythonConstructs["time_drift_float"]["body"], test_namespace)
+        exec(construct_code("time_drift_float"), test_namespace)
         time_drift_float = test_namespace["time_drift_float"]
 
         with patch("kinda.personality.register_time_variable"):
@@ -274,7 +274,7 @@ class TestTimeDriftIntConstruct:
     def test_time_drift_int_function_behavior(self):
         """Test time_drift_int function behavior"""
         test_namespace = {}
-        exec(KindaPythonConstructs["time_drift_int"]["body"], test_namespace)
+        exec(construct_code("time_drift_int"), test_namespace)
         time_drift_int = test_namespace["time_drift_int"]
 
         with patch("kinda.personality.register_time_variable") as mock_register:
@@ -288,7 +288,7 @@ class TestTimeDriftIntConstruct:
     def test_time_drift_int_with_fuzz(self):
         """Test time_drift_int with initial fuzz"""
         test_namespace = {}
-        exec(KindaPythonConstructs["time_drift_int"]["body"], test_namespace)
+        exec(construct_code("time_drift_int"), test_namespace)
         time_drift_int = test_namespace["time_drift_int"]
 
         with patch("kinda.personality.register_time_variable"):
@@ -300,7 +300,7 @@ class TestTimeDriftIntConstruct:
     def test_time_drift_int_error_handling(self):
         """Test error handling in time_drift_int"""
         test_namespace = {}
-        exec(KindaPythonConstructs["time_drift_int"]["body"], test_namespace)
+        exec(construct_code("time_drift_int"), test_namespace)
         time_drift_int = test_namespace["time_drift_int"]
 
         with patch("kinda.personality.register_time_variable"):
@@ -2,7 +2,13 @@
 
 import pytest
 from pathlib import Path
-from kinda.langs.python.transformer import transform_line, transform_file
+from unittest.mock import patch
+from kinda.langs.python.transformer import (
+    KindaParseError,
+    transform_file,
+    transform_line,
+    transform_source,
+)
 
 
 class TestPythonTransformExecution:
@@ -77,19 +83,17 @@ class TestPythonFileTransforms:
         assert "x = kinda_int(5)" in result
         assert "sorta_print(x)" in result
 
-    def test_transform_sometimes_block(self, tmp_path):
+    def test_transform_sometimes_block(self):
         """Test transforming sometimes blocks with proper indentation"""
-        test_file = tmp_path / "sometimes.knda"
-        test_file.write_text(
+        result = transform_source(
             """~kinda int x = 1;
 ~sometimes (x > 0) {
     x ~= 10;
     ~sorta print(x);
 }
-"""
+""",
+            "sometimes.knda",
         )
-
-        result = transform_file(test_file)
         lines = result.split("\n")
 
         # Find the sometimes line
@@ -109,20 +113,18 @@ class TestPythonFileTransforms:
             "    " in line and "sorta_print" in line for line in lines
         ), "Block should be indented"
 
-    def test_mixed_constructs_file(self, tmp_path):
+    def test_mixed_constructs_file(self):
         """Test file with multiple different constructs"""
-        test_file = tmp_path / "mixed.knda"
-        test_file.write_text(
+        result = transform_source(
             """# Comment at top
 ~kinda int a = 1;
 normal_var = 42
 a ~= 5;
 ~sorta print(a);
-"""
+""",
+            "mixed.knda",
         )
 
-        result = transform_file(test_file)
-
         # Should preserve comment
         assert "# Comment at top" in result
 
@@ -137,6 +139,24 @@ a ~= 5;
         # Should have proper imports
         assert "from kinda.langs.python.runtime.fuzzy import" in result
 
+    def test_plain_python_source_matches_line_pass(self):
+        """Test a source without any tilde comes out as the per-line pass would emit it"""
+        source = "# header\nimport os\n   \n\tx = 1  \n\nprint(x)\n"
+        expected = "\n".join(line for text in source.splitlines() for line in transform_line(text))
+
+        with patch("kinda.langs.python.transformer.transform_line") as mock_transform_line:
+            result = transform_source(source, "plain.knda")
+
+        mock_transform_line.assert_not_called()
+        assert result == expected
+
+    def test_header_imports_only_this_files_helpers(self):
+        """Test helpers used by an earlier source don't leak into the next one's import line"""
+        transform_source("~sorta print(x)\n", "first.knda")
+        result = transform_source("~kinda int x = 1\n", "second.knda")
+
+        assert result.splitlines()[0] == "from kinda.langs.python.runtime.fuzzy import kinda_int"
+
 
 class TestTransformEdgeCases:
     """Test edge cases and complex scenarios"""
@@ -177,3 +197,11 @@ class TestTransformEdgeCases:
             assert isinstance(result, list)
             assert len(result) > 0
             # Should preserve or handle whitespace appropriately
+
+    def test_transform_source_reports_filename(self):
+        """Test in-memory sources report the given name in parse errors"""
+        with pytest.raises(KindaParseError) as exc_info:
+            transform_source("x = 1\n~sometimes {\n}\n", "virtual.knda")
+
+        assert exc_info.value.file_path == "virtual.knda"
+        assert exc_info.value.line_number == 2
@@ -5,6 +5,7 @@ import subprocess
 import tempfile
 from pathlib import Path
 from kinda.langs.python.transformer import transform
+from tests.python.utils import assert_all_in
 
 
 class TestTransformIntegration:
@@ -29,6 +30,15 @@ class TestTransformIntegration:
         assert "kinda_int" in content
         assert "sorta_print" in content
 
+    def test_transform_accepts_string_paths(self, tmp_path):
+        """Test transform() takes plain string paths like the CLI passes"""
+        knda_file = tmp_path / "test_strings.knda"
+        knda_file.write_text("~kinda int x = 5;\n")
+
+        output_paths = transform(str(knda_file), str(tmp_path / "output"))
+        assert output_paths == [tmp_path / "output" / "test_strings.py"]
+        assert output_paths[0].exists()
+
     def test_end_to_end_sometimes_block(self, tmp_path):
         """Test sometimes block transforms correctly"""
         knda_file = tmp_path / "test_sometimes.knda"
@@ -172,20 +182,23 @@ for i in range(3):
 
         content = py_file.read_text()
 
-        # Should preserve regular Python (for loop, etc)
-        assert "for i in range(3):" in content
-
-        # Should transform kinda constructs
-        assert "counter = kinda_int(0)" in content
-        assert "fuzzy_assign('counter'" in content
-        assert "if sometimes(counter > 2):" in content
-        assert "if maybe(counter < 5):" in content
-        assert "sorta_print(" in content
-
-        # Should preserve comments
-        assert "# Complex test file" in content
-        assert "# Loop simulation" in content
-        assert "# Test maybe construct integration" in content
+        assert_all_in(
+            [
+                # Should preserve regular Python (for loop, etc)
+                "for i in range(3):",
+                # Should transform kinda constructs
+                "counter = kinda_int(0)",
+                "fuzzy_assign('counter'",
+                "if sometimes(counter > 2):",
+                "if maybe(counter < 5):",
+                "sorta_print(",
+                # Should preserve comments
+                "# Complex test file",
+                "# Loop simulation",
+                "# Test maybe construct integration",
+            ],
+            content,
+        )
 
 
 class TestTransformCLI:
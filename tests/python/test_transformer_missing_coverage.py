@@ -67,6 +67,15 @@ class TestValidateConditionalSyntax:
         assert error.line_number == 10
         assert error.file_path == "example.knda"
 
+    @pytest.mark.parametrize("construct", ["~probably", "~rarely"])
+    def test_invalid_probably_and_rarely_syntax(self, construct):
+        """Test every conditional gets its own parentheses hint."""
+        with pytest.raises(KindaParseError) as exc_info:
+            _validate_conditional_syntax(construct + " {", 3, "test.knda")
+
+        assert f"{construct} needs parentheses" in str(exc_info.value)
+        assert f"Try: {construct}() or {construct}(condition)" in str(exc_info.value)
+
     def test_other_constructs_pass_through(self):
         """Test other constructs don't trigger validation errors."""
         result = _validate_conditional_syntax("~sorta print('hello')", 1, "test.knda")
@@ -271,6 +280,23 @@ class TestTransformLineErrorHandling:
         assert isinstance(result, list)
         assert len(result) >= 1
 
+    def test_plain_python_line_skips_construct_passes(self):
+        """Test lines without a tilde are returned without running any matcher."""
+        with patch("kinda.langs.python.transformer.find_ish_constructs") as find_ish:
+            with patch("kinda.langs.python.transformer.match_python_construct") as match:
+                assert transform_line("    total = sum(values)") == ["    total = sum(values)"]
+        find_ish.assert_not_called()
+        match.assert_not_called()
+
+    def test_construct_handlers_cover_known_constructs(self):
+        """Test construct handlers are keyed by real constructs and dispatch correctly."""
+        from kinda.grammar.python.constructs import KindaPythonConstructs
+        from kinda.langs.python.transformer import _CONSTRUCT_HANDLERS
+
+        assert set(_CONSTRUCT_HANDLERS) <= set(KindaPythonConstructs)
+        assert transform_line("count ~= 7") == ["count = fuzzy_assign('count', 7)"]
+        assert transform_line("~rarely(x > 1) {") == ["if rarely(x > 1):"]
+
 
 class TestEdgeCasesAndIntegration:
     """Test edge cases and integration scenarios."""
@@ -345,3 +371,114 @@ sometimes (True) {  # Missing ~
         error = exc_info.value
         assert "~maybe needs parentheses" in str(error)
         assert error.line_number == 15
+
+
+class TestDirectoryTransform:
+    """Test transform() on directories, sequentially and with a process pool."""
+
+    def _write_sources(self, root):
+        (root / "nested").mkdir(parents=True)
+        sources = {
+            "a.knda": "~kinda int x = 1",
+            "b.py.knda": "~sorta print('hi')",
+            "nested/c.knda": "y ~= 2",
+        }
+        for name, source in sources.items():
+            (root / name).write_text(source + "\n", encoding="utf-8")
+
+    @pytest.mark.parametrize("cpu_count", [1, 4])
+    def test_directory_outputs_mirror_sources(self, tmp_path, cpu_count):
+        """Test a directory transforms the same way with and without worker processes."""
+        from kinda.langs.python import transformer
+
+        self._write_sources(tmp_path / "src")
+        with patch.object(transformer, "_PARALLEL_MIN_FILES", 1):
+            with patch("kinda.langs.python.transformer.os.cpu_count", return_value=cpu_count):
+                output_paths = transformer.transform(tmp_path / "src", tmp_path / "out")
+
+        relative = sorted(p.relative_to(tmp_path / "out").as_posix() for p in output_paths)
+        assert relative == ["a.py", "b.py", "nested/c.py"]
+        assert "x = kinda_int(1)" in (tmp_path / "out" / "a.py").read_text()
+        assert "fuzzy_assign" in (tmp_path / "out" / "nested" / "c.py").read_text()
+        assert {"kinda_int", "sorta_print", "fuzzy_assign"} <= transformer.used_helpers
+
+    @pytest.mark.parametrize("cpu_count", [1, 4])
+    def test_transform_files_returns_code_per_path(self, tmp_path, cpu_count):
+        """Test transform_files gives the same per-file code with and without worker processes."""
+        from kinda.langs.python import transformer
+
+        self._write_sources(tmp_path)
+        paths = [tmp_path / "a.knda", str(tmp_path / "b.py.knda"), tmp_path / "nested" / "c.knda"]
+        with patch.object(transformer, "_PARALLEL_MIN_FILES", 1):
+            with patch("kinda.langs.python.transformer.os.cpu_count", return_value=cpu_count):
+                results = transformer.transform_files(paths)
+
+        assert list(results) == [Path(path) for path in paths]
+        assert results[tmp_path / "a.knda"].endswith("x = kinda_int(1)")
+        assert "import sorta_print\n" in results[tmp_path / "b.py.knda"]
+        assert "y = fuzzy_assign('y', 2)" in results[tmp_path / "nested" / "c.knda"]
+        assert {"kinda_int", "sorta_print", "fuzzy_assign"} <= transformer.used_helpers
+
+    def test_parse_errors_survive_pickling(self):
+        """Test KindaParseError keeps its fields when sent back from a worker process."""
+        import pickle
+
+        error = KindaParseError("Bad tilde", 3, "~kinda x", "broken.knda")
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert str(restored) == str(error)
+        assert (restored.line_number, restored.file_path) == (3, "broken.knda")
+
+    def test_runtime_written_once_per_process(self, tmp_path):
+        """Test the runtime is only regenerated when it's new, changed or gone."""
+        from kinda.langs.python import transformer
+
+        runtime_path = tmp_path / "runtime"
+        with patch.object(transformer, "_generated_runtimes", {}):
+            with patch.object(transformer, "generate_runtime") as gen:
+                gen.side_effect = lambda path: (path / "fuzzy.py").write_text("env = {}\n")
+                transformer._ensure_runtime(runtime_path)
+                transformer._ensure_runtime(runtime_path)
+                assert gen.call_count == 1
+
+                with (runtime_path / "fuzzy.py").open("a") as f:
+                    f.write("def extra_helper(): pass\n")
+                transformer._ensure_runtime(runtime_path)
+                assert gen.call_count == 2
+
+                (runtime_path / "fuzzy.py").unlink()
+                transformer._ensure_runtime(runtime_path)
+                assert gen.call_count == 3
+
+
+class TestTransformLineHelpers:
+    """Test how transform_line records the runtime helpers a line needs."""
+
+    def test_used_helper_names_are_interned(self):
+        """Test helper names recorded by transform_line are the interned string objects."""
+        from kinda.langs.python import transformer
+
+        lines = ["~kinda int x = 1", "y ~= 2", "~maybe(x) {", "z = 5~ish", "a = f() ~welp 1"]
+        with patch.object(transformer, "used_helpers", set()):
+            for line in lines:
+                transform_line(line)
+            helpers = set(transformer.used_helpers)
+
+        assert {"kinda_int", "fuzzy_assign", "maybe", "ish_value", "welp_fallback"} <= helpers
+        assert all(name is sys.intern(name) for name in helpers)
+
+    def test_repeated_line_records_helpers_from_cache(self):
+        """Test a cached transform_line result still records the helpers the line needs."""
+        from kinda.langs.python import transformer
+
+        line = "~kinda float cached_ratio ~= 0.5"
+        first = transform_line(line)
+        with patch.object(transformer, "used_helpers", set()):
+            with patch("kinda.langs.python.transformer.match_python_construct") as match:
+                second = transform_line(line)
+            assert transformer.used_helpers == {"kinda_float"}
+        match.assert_not_called()
+
+        assert second == first == ["cached_ratio = kinda_float(0.5)"]
+        second.append("mutated")
+        assert transform_line(line) == first
@@ -53,6 +53,14 @@ class TestWelpMatching:
         assert patterns[0][0] == "welp"  # construct type
         assert patterns[0][1].group() == "risky_operation ~welp fallback_value"  # matched pattern
 
+    def test_welp_match_objects_share_one_type(self):
+        """Test that welp match objects come from a single module-level class."""
+        first = find_welp_constructs("a = f() ~welp 1")[0][1]
+        second = find_welp_constructs("b = g(x) ~welp 2")[0][1]
+        assert type(first) is type(second)
+        assert (second.group(1), second.group(2)) == ("g(x)", "2")
+        assert (second.start(), second.end()) == (4, 16)
+
     def test_skip_welp_in_strings(self):
         """Test that ~welp inside strings is ignored."""
         patterns = find_welp_constructs('print("Operation ~welp failed")')
@@ -142,6 +150,11 @@ class TestWelpIntegration:
         # Should NOT contain welp_fallback function call
         assert "welp_fallback" not in result[0]
 
+    def test_welp_in_string_keeps_other_transforms(self):
+        """Test that a literal ~welp in a string doesn't undo the line's other constructs."""
+        result = transform_line('print("x ~welp y", 5~ish)')
+        assert result == ['print("x ~welp y", ish_value(5))']
+
     def test_multiple_welp_constructs(self):
         """Test multiple ~welp constructs on same line."""
         result = transform_line("x = op1() ~welp 'a', y = op2() ~welp 'b'")
@@ -149,6 +162,15 @@ class TestWelpIntegration:
         assert "welp_fallback(lambda: op1(), 'a')" in result[0]
         assert "welp_fallback(lambda: op2(), 'b')" in result[0]
 
+    def test_chained_welp_nests(self):
+        """Test a chain of ~welp fallbacks nests into valid Python."""
+        result = transform_line("x = a ~welp b ~welp c")
+        assert result == ["x = welp_fallback(lambda: welp_fallback(lambda: a, b), c)"]
+        compile(result[0], "<chained welp>", "exec")
+
+        result = transform_line("x = g(a ~welp 1) ~welp 2")
+        assert result == ["x = welp_fallback(lambda: g(welp_fallback(lambda: a, 1)), 2)"]
+
 
 class TestWelpFileTransformation:
     """Test complete file transformation with ~welp constructs."""
@@ -282,3 +304,61 @@ class TestWelpEdgeCases:
         result = transform_line("val = config['key']['subkey'] ~welp 'default'")
         assert isinstance(result, list)
         assert "welp_fallback(lambda: config['key']['subkey'], 'default')" in result[0]
+
+
+class TestWelpMessages:
+    """Test personality-styled ~welp messages."""
+
+    @pytest.mark.parametrize(
+        "style, none_msg, error_msg",
+        [
+            ("professional", "Expression returned None", "Operation failed (KeyError: 'k')"),
+            ("friendly", "Got nothing there", "Oops, that didn't work ('k')"),
+            ("snarky", "Well that was useless", "Predictably failed with KeyError"),
+            ("chaotic", "*shrugs* That didn't work", "BOOM! 'k' *CRASH*"),
+        ],
+    )
+    def test_welp_messages_per_style(self, style, none_msg, error_msg, capsys):
+        """Test each error message style picks its own template."""
+        from kinda.grammar.python.constructs import construct_function
+
+        fallback = construct_function("welp")
+
+        def missing_key():
+            return {}["k"]
+
+        with patch(
+            "kinda.personality.PersonalityContext.get_error_message_style", return_value=style
+        ):
+            assert fallback(lambda: None, [1]) == [1]
+            assert fallback(missing_key, "x") == "x"
+
+        none_line, error_line = capsys.readouterr().out.splitlines()
+        assert none_line.startswith(f"[welp] {none_msg}") and none_line.endswith(": [1]")
+        assert error_line.startswith(f"[welp] {error_msg}") and error_line.endswith(": 'x'")
+
+    @pytest.mark.parametrize("mood", ["reliable", "cautious", "playful", "chaotic"])
+    def test_style_is_the_table_key_object(self, mood):
+        """Test that styles are interned literals, so table lookups hit on identity."""
+        from kinda.grammar.python.constructs import construct_function
+        from kinda.personality import PersonalityContext
+
+        table = construct_function("welp").__globals__["_WELP_NONE_MESSAGES"]
+        style = PersonalityContext(mood, 5).get_error_message_style()
+        assert any(key is style for key in table)
+
+    def test_quiet_mode_skips_message_and_repr(self, capsys):
+        """Test that KINDA_WELP_QUIET-style silencing never formats the fallback."""
+        from kinda.grammar.python.constructs import construct_function
+
+        class NoRepr:
+            def __repr__(self):
+                raise AssertionError("repr should not be needed when quiet")
+
+        fallback = construct_function("welp")
+        marker = NoRepr()
+        with patch.dict(fallback.__globals__, {"_WELP_QUIET": True}):
+            assert fallback(lambda: None, marker) is marker
+            assert fallback(lambda: 1 / 0, marker) is marker
+
+        assert capsys.readouterr().out == ""
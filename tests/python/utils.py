@@ -14,3 +14,9 @@ def run_python_file(filepath):
         env=env,
     )
     return result.stdout.strip()
+
+
+def assert_all_in(needles, haystack):
+    """Assert every needle occurs in haystack, reporting all missing ones at once"""
+    missing = [n for n in needles if n not in haystack]
+    assert not missing, f"Missing from output: {missing}"